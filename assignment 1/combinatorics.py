@@ -0,0 +1,146 @@
+from array import array
+
+from task1 import is_prime
+
+# Table size built up front; the tables then grow on demand.
+DEFAULT_LIMIT = 1 << 16
+
+# Above this many entries the tables stop growing and large arguments are
+# answered with a direct O(k) product instead.
+MAX_TABLE_SIZE = 1 << 24
+
+class ModCombinatorics:
+    """Binomials, permutations and multinomials modulo a prime p.
+
+    Factorials and inverse factorials mod p are kept in two arrays, so each
+    query below the table size is a couple of lookups and multiplications.
+    The arrays grow lazily (doubling) up to min(p, MAX_TABLE_SIZE), and
+    Lucas' theorem reduces arguments >= p to base-p digits.
+    """
+
+    def __init__(self, p: int, limit: int = DEFAULT_LIMIT) -> None:
+        if not is_prime(p):
+            raise ValueError(f"modulus must be prime, got {p}")
+        self.p = p
+        if p < 1 << 64:
+            self._fact, self._inv_fact = array("Q", [1]), array("Q", [1])
+        else:
+            self._fact, self._inv_fact = [1], [1]
+        self._grow(limit)
+
+    @property
+    def size(self) -> int:
+        """Number of factorials currently tabulated (0! .. (size-1)!)."""
+        return len(self._fact)
+
+    def _grow(self, limit: int) -> None:
+        """Extend the tables to cover 0..limit-1 (never past p - 1)."""
+        limit = min(limit, self.p, MAX_TABLE_SIZE)
+        start = len(self._fact)
+        if limit <= start:
+            return
+        p = self.p
+        fact = self._fact
+        value = fact[-1]
+        for i in range(start, limit):
+            value = value * i % p
+            fact.append(value)
+        # Inverse factorials: invert the top one, then walk back down
+        inv = [0] * (limit - start)
+        value = pow(fact[limit - 1], p - 2, p)
+        for i in range(limit - 1, start - 1, -1):
+            inv[i - start] = value
+            value = value * i % p
+        self._inv_fact.extend(inv)
+
+    def _ensure(self, n: int) -> bool:
+        """Make sure n! is tabulated; return False if that would exceed MAX_TABLE_SIZE."""
+        if n < len(self._fact):
+            return True
+        if n >= MAX_TABLE_SIZE:
+            return False
+        self._grow(max(n + 1, 2 * len(self._fact)))
+        return True
+
+    def _small_binomial(self, n: int, k: int) -> int:
+        """C(n, k) mod p for 0 <= n < p."""
+        if k < 0 or k > n:
+            return 0
+        if self._ensure(n):
+            return self._fact[n] * self._inv_fact[k] % self.p * self._inv_fact[n - k] % self.p
+        # n is too big to tabulate: C(n, k) = n(n-1)...(n-k+1) / k!
+        k = min(k, n - k)
+        p = self.p
+        numerator = denominator = 1
+        for i in range(k):
+            numerator = numerator * (n - i) % p
+            denominator = denominator * (i + 1) % p
+        return numerator * pow(denominator, p - 2, p) % p
+
+    def binomial(self, n: int, k: int) -> int:
+        """Return C(n, k) mod p; 0 when k < 0 or k > n."""
+        if n < 0 or k < 0 or k > n:
+            return 0
+        p = self.p
+        if n < p:
+            return self._small_binomial(n, k)
+        # Lucas: C(n, k) = prod C(n_i, k_i) over the base-p digits
+        result = 1
+        while n and result:
+            n, n_digit = divmod(n, p)
+            k, k_digit = divmod(k, p)
+            result = result * self._small_binomial(n_digit, k_digit) % p
+        return result
+
+    def permutations(self, n: int, k: int) -> int:
+        """Return P(n, k) = n! / (n-k)! mod p; 0 when k < 0 or k > n."""
+        if n < 0 or k < 0 or k > n:
+            return 0
+        p = self.p
+        top = n % p
+        if k > top:
+            # n, n-1, ..., n-k+1 passes a multiple of p
+            return 0
+        if self._ensure(top):
+            return self._fact[top] * self._inv_fact[top - k] % p
+        result = 1
+        for i in range(k):
+            result = result * (top - i) % p
+        return result
+
+    def multinomial(self, counts) -> int:
+        """Return (sum of counts)! / prod(count!) mod p."""
+        result = 1
+        total = 0
+        for c in counts:
+            if c < 0:
+                return 0
+            total += c
+            result = result * self.binomial(total, c) % self.p
+        return result
+
+    def binomial_many(self, ns, ks) -> list[int]:
+        """Batch form of binomial for paired sequences of n and k."""
+        ns, ks = list(ns), list(ks)
+        if len(ns) != len(ks):
+            raise ValueError("ns and ks must have the same length")
+        if not ns:
+            return []
+        largest = max(ns)
+        if largest < self.p and min(ns) >= 0 and self._ensure(largest):
+            # Every n is tabulated: answer with plain lookups
+            fact, inv_fact, p = self._fact, self._inv_fact, self.p
+            return [fact[n] * inv_fact[k] % p * inv_fact[n - k] % p if 0 <= k <= n else 0
+                    for n, k in zip(ns, ks)]
+        return [self.binomial(n, k) for n, k in zip(ns, ks)]
+
+if __name__ == "__main__":
+    try:
+        p = int(input("Enter a prime modulus p: ").strip())
+        comb = ModCombinatorics(p)
+        n = int(input("Enter n: ").strip())
+        k = int(input("Enter k: ").strip())
+        print(f"C({n}, {k}) mod {p} = {comb.binomial(n, k)}")
+        print(f"P({n}, {k}) mod {p} = {comb.permutations(n, k)}")
+    except ValueError as e:
+        print(f"Invalid input: {e}")
@@ -0,0 +1,125 @@
+import functools
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from task1 import _SMALL_PRIMES, is_prime
+
+import repo_root  # puts the repository root on sys.path
+from factoring import pollard_brent
+
+# Maximum number of cofactors whose factorizations are kept between calls.
+FACTOR_CACHE_SIZE = 65_536
+
+# Batches smaller than this are factored in-process; a pool costs more to start.
+MIN_PARALLEL_BATCH = 256
+
+@functools.lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def _factor_cofactor(n: int) -> tuple[tuple[int, int], ...]:
+    """Factor n, which has no prime factor below 1000, as sorted (prime, exponent) pairs.
+
+    Both halves of every split go back through this cached function, so
+    sub-factorizations found for one number are reused by later calls.
+    """
+    if n == 1:
+        return ()
+    if is_prime(n):
+        return ((n, 1),)
+    root = math.isqrt(n)
+    if root * root == n:
+        return tuple((p, 2 * e) for p, e in _factor_cofactor(root))
+    d = pollard_brent(n)
+    merged = Counter(dict(_factor_cofactor(d)))
+    merged.update(dict(_factor_cofactor(n // d)))
+    return tuple(sorted(merged.items()))
+
+def factorize(n: int) -> dict[int, int]:
+    """Return the prime factorization of n as a {prime: exponent} dict.
+
+    Primes below 1000 are removed by trial division; whatever remains is
+    split with Pollard-Brent rho, using is_prime to stop the recursion.
+    factorize(1) is an empty dict. Raises ValueError for n < 1.
+    """
+    if n < 1:
+        raise ValueError("factorize is only defined for positive integers")
+    factors: dict[int, int] = {}
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            break
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors[p] = e
+    if n > 1:
+        for p, e in _factor_cofactor(n):
+            factors[p] = factors.get(p, 0) + e
+    return factors
+
+def factorize_many(numbers, workers: int | None = None) -> list[dict[int, int]]:
+    """Factor every value in numbers, returning the results in input order.
+
+    Repeated values are factored once. Large batches are spread across a
+    process pool; each worker keeps its own factor cache.
+    """
+    values = list(numbers)
+    unique = list(dict.fromkeys(values))
+    if len(unique) < MIN_PARALLEL_BATCH or workers == 1:
+        results = [factorize(n) for n in unique]
+    else:
+        workers = workers or os.cpu_count() or 1
+        chunk = max(1, len(unique) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(factorize, unique, chunksize=chunk))
+    lookup = dict(zip(unique, results))
+    return [dict(lookup[n]) for n in values]
+
+def clear_factor_cache() -> None:
+    """Drop every cached cofactor factorization."""
+    _factor_cofactor.cache_clear()
+
+def format_factorization(factors: dict[int, int]) -> str:
+    """Render {2: 3, 5: 1} as '2^3 * 5'."""
+    if not factors:
+        return "1"
+    return " * ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in sorted(factors.items()))
+
+def benchmark_factorize(count: int = 2_000, bits: int = 60) -> None:
+    """Time serial, cached and pooled factorization of random bits-bit integers."""
+    numbers = [random.getrandbits(bits) | 1 for _ in range(count)]
+    print("=" * 60)
+    print(f"FACTORIZATION BENCHMARK ({count} random {bits}-bit integers)")
+    print("=" * 60)
+    clear_factor_cache()
+    start = time.perf_counter()
+    pooled = factorize_many(numbers)
+    t_pooled = time.perf_counter() - start
+    clear_factor_cache()
+    start = time.perf_counter()
+    serial = [factorize(n) for n in numbers]
+    t_serial = time.perf_counter() - start
+    start = time.perf_counter()
+    [factorize(n) for n in numbers]
+    t_cached = time.perf_counter() - start
+    if serial != pooled:
+        raise AssertionError("pooled factorizations differ from serial ones")
+    print(f"Serial (cold cache): {t_serial:.3f} s")
+    print(f"Serial (warm cache): {t_cached:.3f} s")
+    print(f"Process pool (cold): {t_pooled:.3f} s")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Factor an integer\n2. Run benchmark\nEnter choice (1-2): ").strip()
+        if choice == "1":
+            num = int(input("Enter a positive integer to factor: ").strip())
+            print(f"{num} = {format_factorization(factorize(num))}")
+        elif choice == "2":
+            benchmark_factorize()
+        else:
+            print("Invalid choice!")
+    except ValueError as e:
+        print(f"Invalid input: {e}")
@@ -0,0 +1,101 @@
+import mmap
+import os
+import struct
+
+from task1 import _odd_segments, is_prime as _is_prime
+
+# File layout: 4-byte magic, 8-byte little-endian limit N, then one bit per
+# odd number m <= N (bit m // 2, least significant bit first).
+MAGIC = b"PBM1"
+HEADER = struct.Struct("<4sQ")
+
+# Maps a sieve flag byte (0 or 1) to the ASCII digit used by int(..., 2).
+_FLAG_TO_DIGIT = bytes.maketrans(b"\x00\x01", b"01")
+
+def _pack_bits(flags: bytes) -> bytes:
+    """Pack a run of 0/1 flag bytes (length divisible by 8) into bits, LSB first."""
+    if not flags:
+        return b""
+    value = int(flags.translate(_FLAG_TO_DIGIT)[::-1], 2)
+    return value.to_bytes(len(flags) // 8, "little")
+
+def build_prime_bitmap(path: str, limit: int) -> None:
+    """Write an odd-only prime bitmap covering 0..limit to path.
+
+    The sieve runs segment by segment, so memory stays bounded for any
+    limit. The file is written under a temporary name and renamed into
+    place, so readers never see a half-written bitmap.
+    """
+    if limit < 2:
+        raise ValueError("limit must be at least 2")
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, limit))
+        pending = bytearray(b"\x00")  # the odd number 1 is not prime
+        for _, flags in _odd_segments(3, limit + 1):
+            pending += flags
+            whole = len(pending) - len(pending) % 8
+            f.write(_pack_bits(bytes(pending[:whole])))
+            del pending[:whole]
+        if pending:
+            pending += bytes(-len(pending) % 8)
+            f.write(_pack_bits(bytes(pending)))
+    os.replace(tmp_path, path)
+
+class PrimeBitmap:
+    """Read-only view of a bitmap written by build_prime_bitmap.
+
+    The file is memory-mapped, so opening it costs nothing up front and
+    every process that maps the same file shares one copy in the page cache.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a prime bitmap file")
+        magic, self.limit = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a prime bitmap file")
+
+    def is_prime(self, n: int) -> bool:
+        """Return True if n is prime, using one bit test for n <= limit."""
+        if n > self.limit:
+            return _is_prime(n)
+        if n % 2 == 0:
+            return n == 2
+        if n < 3:
+            return False
+        index = n >> 1
+        return bool(self._map[HEADER.size + (index >> 3)] >> (index & 7) & 1)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Build a prime bitmap\n2. Query a prime bitmap\nEnter choice (1-2): ").strip()
+        path = input("Enter the bitmap file path: ").strip()
+        if choice == "1":
+            limit = int(input("Enter the largest number to cover: ").strip())
+            build_prime_bitmap(path, limit)
+            print(f"Wrote bitmap for 0..{limit} to {path} ({os.path.getsize(path)} bytes).")
+        elif choice == "2":
+            with PrimeBitmap(path) as bitmap:
+                num = int(input("Enter an integer to check for primality: ").strip())
+                print(f"{num} is prime." if bitmap.is_prime(num) else f"{num} is not prime.")
+        else:
+            print("Invalid choice!")
+    except ValueError as e:
+        print(f"Invalid input: {e}")
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
@@ -1,27 +1,402 @@
 # ...existing code...
 
+import itertools
 import math
+import random
+import time
+from array import array
+
+# Odd numbers sieved per segment; one byte each keeps a segment at 32 KiB,
+# small enough to stay resident in L1/L2 cache while it is being crossed off.
+SEGMENT_SIZE = 1 << 15
+
+# Above this value is_prime switches from trial division to Miller-Rabin.
+MILLER_RABIN_THRESHOLD = 1_000_000
+
+# The first 13 prime bases make Miller-Rabin exact for every n below this bound.
+DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
 
 def is_prime(n: int) -> bool:
-    """Return True if n is prime, otherwise False."""
+    """Return True if n is prime, otherwise False.
+
+    Values above MILLER_RABIN_THRESHOLD are handed to is_probable_prime,
+    which is exact below DETERMINISTIC_LIMIT.
+    """
     if n <= 1:
         return False
     if n <= 3:
         return True
     if n % 2 == 0:
         return False
+    if n > MILLER_RABIN_THRESHOLD:
+        return is_probable_prime(n)
     limit = math.isqrt(n)
     for i in range(3, limit + 1, 2):
         if n % i == 0:
             return False
     return True
 
+def _base_primes(limit: int) -> list[int]:
+    """Return the odd primes <= limit using a plain odd-only sieve."""
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2  # index i stands for 2*i + 3
+    sieve = bytearray(b"\x01") * size
+    for i in range((math.isqrt(limit) - 1) // 2):
+        if sieve[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            sieve[start::p] = bytes(len(range(start, size, p)))
+    return [2 * i + 3 for i, flag in enumerate(sieve) if flag]
+
+# Shared trial-division prefilter: one gcd against the product of all primes
+# below 1000 rejects most composites before any modular exponentiation.
+_SMALL_PRIMES = [2] + _base_primes(1000)
+_SMALL_PRIME_PRODUCT = math.prod(_SMALL_PRIMES)
+_DETERMINISTIC_BASES = _SMALL_PRIMES[:13]
+
+def _strong_probable_prime(n: int, d: int, s: int, base: int) -> bool:
+    """Return True if n passes the strong Fermat test to the given base.
+
+    n - 1 must equal d * 2**s with d odd.
+    """
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def _miller_rabin(n: int, rounds: int) -> bool:
+    """Run Miller-Rabin on an odd n that has already passed the prefilter."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = _DETERMINISTIC_BASES
+    if n >= DETERMINISTIC_LIMIT:
+        bases = bases + [random.randrange(2, n - 1) for _ in range(rounds)]
+    return all(_strong_probable_prime(n, d, s, a) for a in bases)
+
+def is_probable_prime(n: int, rounds: int = 20) -> bool:
+    """Miller-Rabin primality test behind a small-prime prefilter.
+
+    The answer is exact for n < DETERMINISTIC_LIMIT. Above that, rounds
+    extra random bases are tried, so a composite slips through with
+    probability below 4**-rounds.
+    """
+    if n < 2:
+        return False
+    if n <= _SMALL_PRIMES[-1]:
+        return n in _SMALL_PRIMES
+    if math.gcd(n, _SMALL_PRIME_PRODUCT) != 1:
+        return False
+    return _miller_rabin(n, rounds)
+
+def is_probable_prime_many(numbers, rounds: int = 20) -> list[bool]:
+    """Batch form of is_probable_prime, returning one flag per input value.
+
+    Repeated values are tested once, and the prefilter product is shared
+    by every candidate in the batch.
+    """
+    values = list(numbers)
+    small_set = set(_SMALL_PRIMES)
+    largest_small = _SMALL_PRIMES[-1]
+    product = _SMALL_PRIME_PRODUCT
+    gcd = math.gcd
+    seen: dict[int, bool] = {}
+    for n in values:
+        if n in seen:
+            continue
+        if n <= largest_small:
+            seen[n] = n in small_set
+        elif gcd(n, product) != 1:
+            seen[n] = False
+        else:
+            seen[n] = _miller_rabin(n, rounds)
+    return [seen[n] for n in values]
+
+def _odd_segments(lo: int, hi: int):
+    """Yield (low, flags) pairs covering the odd numbers in [lo, hi).
+
+    flags[i] is 1 when low + 2*i is prime. Each segment holds at most
+    SEGMENT_SIZE odd numbers, so memory stays constant however wide the
+    window is. Only numbers >= 3 are covered; callers handle 2 themselves.
+    """
+    lo = max(lo, 3)
+    if lo % 2 == 0:
+        lo += 1
+    if lo >= hi:
+        return
+    primes = _base_primes(math.isqrt(hi - 1))
+    low = lo
+    while low < hi:
+        size = min(SEGMENT_SIZE, (hi - low + 1) // 2)
+        high = low + 2 * size
+        flags = bytearray(b"\x01") * size
+        for p in primes:
+            start = p * p
+            if start >= high:
+                break
+            if start < low:
+                # first odd multiple of p that is >= low
+                start = -(-low // p) * p
+                if start % 2 == 0:
+                    start += p
+            first = (start - low) // 2
+            flags[first::p] = bytes(len(range(first, size, p)))
+        yield low, flags
+        low = high
+
+def primes_between(lo: int, hi: int):
+    """Yield the primes p with lo <= p < hi in increasing order.
+
+    Uses a segmented Sieve of Eratosthenes, so a wide window costs one
+    cache-sized buffer instead of one trial-division loop per number.
+    """
+    if lo <= 2 < hi:
+        yield 2
+    for low, flags in _odd_segments(lo, hi):
+        index = flags.find(1)
+        while index != -1:
+            yield low + 2 * index
+            index = flags.find(1, index + 1)
+
+def _sieve_is_cheaper(lo: int, hi: int, count: int) -> bool:
+    """Estimate whether sieving [lo, hi) beats count Miller-Rabin tests.
+
+    The unit is one base prime crossed off one segment (a Python loop step).
+    The sieve pays that for every prime up to isqrt(hi) in every segment,
+    plus the bytearray work over the window and the base-prime sieve; a
+    Miller-Rabin test costs a few units, more for longer numbers.
+    """
+    root = math.isqrt(hi - 1)
+    base_primes = 3 * root // (2 * max(root.bit_length(), 1))  # ~ root / ln(root)
+    segments = -(-(hi - lo) // (2 * SEGMENT_SIZE))
+    sieve = base_primes * segments + (hi - lo + root) // 64
+    return sieve < count * hi.bit_length() // 8
+
+def is_prime_many(numbers) -> list[bool]:
+    """Return a list of primality flags, one per value in numbers.
+
+    When sieving the window they span (base primes up to isqrt(max) included)
+    is cheaper than testing each value, the window is sieved once; otherwise,
+    for sparse or very large values, this falls back to is_probable_prime_many.
+    """
+    values = list(numbers)
+    if not values:
+        return []
+    lo, hi = min(values), max(values) + 1
+    if not _sieve_is_cheaper(lo, hi, len(values)):
+        return is_probable_prime_many(values)
+    result = [n == 2 for n in values]
+    order = sorted((n, i) for i, n in enumerate(values) if n > 2 and n % 2)
+    pos = 0
+    for low, flags in _odd_segments(lo, hi):
+        high = low + 2 * len(flags)
+        while pos < len(order) and order[pos][0] < high:
+            n, i = order[pos]
+            result[i] = bool(flags[(n - low) // 2])
+            pos += 1
+    return result
+
+# Number of leading primes whose phi values come from a periodic table.
+_PHI_TABLE_PRIMES = 7
+
+def _build_phi_table() -> tuple[int, int, array]:
+    """Return (period, totient, counts) for the first _PHI_TABLE_PRIMES primes.
+
+    counts[r] is the number of 1 <= m <= r coprime to the period, which makes
+    phi(y, _PHI_TABLE_PRIMES) a single lookup for any y.
+    """
+    period = math.prod(_SMALL_PRIMES[:_PHI_TABLE_PRIMES])
+    coprime = bytearray(b"\x01") * period
+    coprime[0] = 0
+    for p in _SMALL_PRIMES[:_PHI_TABLE_PRIMES]:
+        coprime[::p] = bytes(len(range(0, period, p)))
+    counts = array("I", itertools.accumulate(coprime))
+    return period, counts[-1], counts
+
+_PHI_PERIOD, _PHI_TOTIENT, _PHI_COUNTS = _build_phi_table()
+
+class _PrimeCounter:
+    """State shared by one prime_count call: a small sieve and a phi memo."""
+
+    def __init__(self, x: int) -> None:
+        self.limit = max(math.isqrt(x), _SMALL_PRIMES[-1])
+        flags = bytearray(b"\x01") * (self.limit + 1)
+        flags[0:2] = b"\x00\x00"
+        for p in range(2, math.isqrt(self.limit) + 1):
+            if flags[p]:
+                flags[p * p::p] = bytes(len(range(p * p, self.limit + 1, p)))
+        self.pi = array("I", itertools.accumulate(flags))
+        self.primes = [p for p in range(2, self.limit + 1) if flags[p]]
+        self.memo: dict[tuple[int, int], int] = {}
+
+    def phi(self, y: int, b: int) -> int:
+        """Count 1 <= m <= y with no prime factor among the first b primes."""
+        if b <= _PHI_TABLE_PRIMES:
+            if b == _PHI_TABLE_PRIMES:
+                q, r = divmod(y, _PHI_PERIOD)
+                return q * _PHI_TOTIENT + _PHI_COUNTS[r]
+            return self._phi_small(y, b)
+        primes = self.primes
+        if y <= self.limit and primes[b] * primes[b] > y:
+            # every survivor is 1 or a prime larger than the b-th prime
+            return max(self.pi[y] - b, 0) + 1
+        key = (y, b)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+        root_count = self.pi[math.isqrt(y)]
+        end = min(b, root_count)
+        result = self.phi(y, _PHI_TABLE_PRIMES)
+        for i in range(_PHI_TABLE_PRIMES, end):
+            result -= self.phi(y // primes[i], i)
+        # for the remaining primes p_i > sqrt(y), phi(y // p_i, i) is 1 while p_i <= y
+        upper = b if y >= primes[b - 1] else self.pi[y]
+        result -= max(upper - max(end, _PHI_TABLE_PRIMES), 0)
+        self.memo[key] = result
+        return result
+
+    def _phi_small(self, y: int, b: int) -> int:
+        """Plain Legendre recursion for b below the table size."""
+        if b == 0:
+            return y
+        return self._phi_small(y, b - 1) - self._phi_small(y // self.primes[b - 1], b - 1)
+
+def prime_count(x: int) -> int:
+    """Return pi(x), the number of primes <= x, using Meissel's formula.
+
+    pi(x) = phi(x, a) + a - 1 - P2 with a = pi(x**(1/3)). The phi term is
+    memoized and cut short with a periodic table and a sieve up to sqrt(x);
+    P2 needs pi at the points x // p for primes x**(1/3) < p <= sqrt(x),
+    which one segmented-sieve sweep up to x**(2/3) supplies in constant memory.
+    """
+    if x < 2:
+        return 0
+    counter = _PrimeCounter(x)
+    if x <= counter.limit:
+        return counter.pi[x]
+    cube_root = round(x ** (1 / 3))
+    while cube_root ** 3 > x:
+        cube_root -= 1
+    while (cube_root + 1) ** 3 <= x:
+        cube_root += 1
+    a = counter.pi[cube_root]
+    b = counter.pi[math.isqrt(x)]
+    # P2 = sum over a < i <= b of (pi(x // p_i) - (i - 1)), p_i the i-th prime
+    targets = sorted(x // p for p in counter.primes[a:b])
+    p2 = -sum(range(a, b))
+    done = 0
+    while done < len(targets) and targets[done] <= counter.limit:
+        p2 += counter.pi[targets[done]]
+        done += 1
+    count = counter.pi[counter.limit]
+    if done < len(targets):
+        for low, flags in _odd_segments(counter.limit + 1, targets[-1] + 1):
+            high = low + 2 * len(flags)
+            while done < len(targets) and targets[done] < high:
+                t = targets[done]
+                p2 += count + flags.count(1, 0, max(t - low + 2, 0) // 2)
+                done += 1
+            count += flags.count(1)
+    return counter.phi(x, a) + a - 1 - p2
+
+def _sieve_count(x: int) -> int:
+    """Count primes <= x by sieving the whole range (the linear baseline)."""
+    if x < 2:
+        return 0
+    return 1 + sum(flags.count(1) for _, flags in _odd_segments(3, x + 1))
+
+def benchmark_prime_count(points=(10**6, 10**8, 10**10), brute_limit: int = 10**8) -> None:
+    """Time prime_count against sieve counting; brute force is skipped above brute_limit."""
+    print("=" * 60)
+    print("PRIME COUNTING BENCHMARK")
+    print("=" * 60)
+    print(f"{'x':>14} {'pi(x)':>12} {'Meissel (s)':>12} {'sieve (s)':>12}")
+    for x in points:
+        start = time.perf_counter()
+        count = prime_count(x)
+        t_fast = time.perf_counter() - start
+        if x <= brute_limit:
+            start = time.perf_counter()
+            expected = _sieve_count(x)
+            t_brute = f"{time.perf_counter() - start:>12.3f}"
+            if expected != count:
+                raise AssertionError(f"prime_count({x}) = {count}, sieve says {expected}")
+        else:
+            t_brute = f"{'skipped':>12}"
+        print(f"{x:>14} {count:>12} {t_fast:>12.3f} {t_brute}")
+
+def benchmark_miller_rabin(count: int = 10_000, bits: int = 64) -> None:
+    """Time is_probable_prime against is_probable_prime_many on random odd candidates."""
+    candidates = [random.getrandbits(bits) | 1 for _ in range(count)]
+    print("=" * 60)
+    print(f"MILLER-RABIN BENCHMARK ({count} random {bits}-bit candidates)")
+    print("=" * 60)
+    start = time.perf_counter()
+    single = [is_probable_prime(n) for n in candidates]
+    t_single = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = is_probable_prime_many(candidates)
+    t_batch = time.perf_counter() - start
+    if single != batch:
+        raise AssertionError("batch and single Miller-Rabin results differ")
+    print(f"Primes found:   {sum(batch)}")
+    print(f"Single calls:   {t_single:.4f} s ({1e6 * t_single / count:.1f} us/number)")
+    print(f"Batch call:     {t_batch:.4f} s ({1e6 * t_batch / count:.1f} us/number)")
+
+def benchmark_crossover(lo: int = 10**9, widths=(10, 100, 1_000, 10_000, 100_000)) -> None:
+    """Time is_prime against primes_between over growing windows starting at lo."""
+    print("=" * 60)
+    print(f"PRIMALITY BENCHMARK (window start = {lo})")
+    print("=" * 60)
+    print(f"{'width':>10} {'is_prime (s)':>15} {'sieve (s)':>12} {'faster':>10}")
+    crossover = None
+    for width in widths:
+        start = time.perf_counter()
+        slow = [n for n in range(lo, lo + width) if is_prime(n)]
+        t_single = time.perf_counter() - start
+        start = time.perf_counter()
+        fast = list(primes_between(lo, lo + width))
+        t_sieve = time.perf_counter() - start
+        if slow != fast:
+            raise AssertionError(f"sieve disagrees with is_prime for width {width}")
+        winner = "sieve" if t_sieve < t_single else "is_prime"
+        if winner == "sieve" and crossover is None:
+            crossover = width
+        print(f"{width:>10} {t_single:>15.4f} {t_sieve:>12.4f} {winner:>10}")
+    print("-" * 60)
+    if crossover is None:
+        print("is_prime was faster for every width tried.")
+    else:
+        print(f"The sieve wins from a window of about {crossover} numbers.")
+
 if __name__ == "__main__":
     try:
-        s = input("Enter an integer to check for primality: ").strip()
-        num = int(s)
+        choice = input("1. Check a single integer\n2. List primes in a range\n3. Run sieve benchmark\n4. Run Miller-Rabin benchmark\n5. Count primes up to x\n6. Run prime counting benchmark\nEnter choice (1-6): ").strip()
+        if choice == "1":
+            s = input("Enter an integer to check for primality: ").strip()
+            num = int(s)
+            print(f"{num} is prime." if is_prime(num) else f"{num} is not prime.")
+        elif choice == "2":
+            lo = int(input("Enter the start of the range: ").strip())
+            hi = int(input("Enter the end of the range (exclusive): ").strip())
+            print(", ".join(str(p) for p in primes_between(lo, hi)) or "No primes in that range.")
+        elif choice == "3":
+            benchmark_crossover()
+        elif choice == "4":
+            benchmark_miller_rabin()
+        elif choice == "5":
+            x = int(input("Enter x: ").strip())
+            print(f"There are {prime_count(x)} primes <= {x}.")
+        elif choice == "6":
+            benchmark_prime_count()
+        else:
+            print("Invalid choice!")
     except ValueError:
         print("Invalid input: please enter a valid integer.")
-    else:
-        print(f"{num} is prime." if is_prime(num) else f"{num} is not prime.")
 # ...existing code...
\ No newline at end of file
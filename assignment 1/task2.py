@@ -1,14 +1,95 @@
 # ...existing code...
 
+import mmap
+import os
+
+# Bytes of input held in memory at once by reverse_file.
+BLOCK_SIZE = 1 << 20
+
 def reverse_string(s: str) -> str:
     """Return the reversed version of s."""
     return s[::-1]
 
+def _char_start(data, pos: int) -> int:
+    """Move pos back onto the lead byte of the UTF-8 character it falls in.
+
+    A valid sequence has at most three continuation bytes, so pos moves at
+    most three places; invalid input is left to surrogateescape.
+    """
+    for _ in range(3):
+        if pos == 0 or (data[pos] & 0xC0) != 0x80:
+            break
+        pos -= 1
+    return pos
+
+def _reverse_blocks(data, out, block_size: int, decode: bool) -> None:
+    """Write data to out back to front, block_size bytes at a time."""
+    end = len(data)
+    while end > 0:
+        start = max(end - block_size, 0)
+        if decode:
+            start = _char_start(data, start)
+            text = data[start:end].decode("utf-8", errors="surrogateescape")
+            out.write(text[::-1].encode("utf-8", errors="surrogateescape"))
+        else:
+            out.write(data[start:end][::-1])
+        end = start
+
+def _reverse_lines(data, out, block_size: int) -> None:
+    """Write the lines of data to out in reverse order, like tac."""
+    end = len(data)
+    while end > 0:
+        # the line ending at end starts just after the previous newline
+        start = data.rfind(b"\n", 0, end - 1) + 1
+        for pos in range(start, end, block_size):
+            out.write(data[pos:min(pos + block_size, end)])
+        if data[end - 1] != 0x0A:
+            out.write(b"\n")
+        end = start
+
+def reverse_file(src: str, dst: str, mode: str = "char", block_size: int = BLOCK_SIZE) -> None:
+    """Reverse the file src into dst without loading it into memory.
+
+    The input is memory-mapped and read from the end in blocks, so peak
+    memory is about block_size whatever the file size.
+
+    mode "char" reverses UTF-8 text character by character (a multibyte
+    sequence is never split), "byte" reverses raw bytes, and "line"
+    reverses the order of lines like tac; a final line without a newline
+    gets one in the output.
+    Raises ValueError for an unknown mode or a non-positive block_size.
+    """
+    if mode not in ("char", "byte", "line"):
+        raise ValueError("mode must be 'char', 'byte' or 'line'")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+        if os.fstat(f_in.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if mode == "line":
+                _reverse_lines(data, f_out, block_size)
+            else:
+                _reverse_blocks(data, f_out, block_size, decode=(mode == "char"))
+
 if __name__ == "__main__":
     try:
-        s = input("Enter a string to reverse: ")
+        choice = input("1. Reverse a string\n2. Reverse a file\nEnter choice (1-2): ").strip()
+        if choice == "2":
+            src = input("Enter the input file path: ").strip()
+            dst = input("Enter the output file path: ").strip()
+            mode = input("Mode (char/byte/line) [char]: ").strip().lower() or "char"
+        else:
+            s = input("Enter a string to reverse: ")
     except (EOFError, KeyboardInterrupt):
         print("\nNo input provided.")
     else:
-        print(reverse_string(s))
+        if choice == "2":
+            try:
+                reverse_file(src, dst, mode)
+                print(f"Wrote reversed {src} to {dst}.")
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+        else:
+            print(reverse_string(s))
 # ...existing code...
\ No newline at end of file
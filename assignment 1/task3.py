@@ -1,5 +1,23 @@
 # ...existing code...
 
+import itertools
+import math
+import time
+
+from task1 import is_prime
+
+import repo_root  # puts the repository root on sys.path
+from trampoline import run
+
+# 0! .. 255! precomputed; larger n build on top of binary-splitting products.
+_SMALL_FACTORIALS = [1] + list(itertools.accumulate(range(1, 256), lambda a, b: a * b))
+
+# Odd factors multiplied directly before a range is split in two.
+_SPLIT_THRESHOLD = 16
+
+# Numbers multiplied together before each reduction in factorial_mod.
+_MOD_CHUNK = 512
+
 def factorial_recursive(n: int) -> int:
     """Recursive factorial.
     Base case: 0! = 1, 1! = 1.
@@ -8,9 +26,13 @@ def factorial_recursive(n: int) -> int:
     """
     if n < 0:
         raise ValueError("factorial is not defined for negative numbers")
+    return run(_factorial_steps(n))
+
+def _factorial_steps(n: int):
+    """Generator form of factorial_recursive, driven by trampoline.run."""
     if n <= 1:
         return 1
-    return n * factorial_recursive(n - 1)
+    return n * (yield _factorial_steps(n - 1))
 
 def factorial_iterative(n: int) -> int:
     """Iterative factorial using a simple loop.
@@ -23,20 +45,121 @@ def factorial_iterative(n: int) -> int:
         result *= i
     return result
 
+def _odd_product(lo: int, hi: int) -> int:
+    """Product of the odd numbers m with lo < m <= hi, by binary splitting.
+
+    Splitting keeps both operands of every multiplication about the same
+    size, which is where Python's Karatsuba multiplication pays off.
+    """
+    first = (lo + 1) | 1
+    last = hi if hi % 2 else hi - 1
+    if first > last:
+        return 1
+    count = (last - first) // 2 + 1
+    if count <= _SPLIT_THRESHOLD:
+        return math.prod(range(first, last + 1, 2))
+    mid = first + 2 * (count // 2) - 1  # even split point between the halves
+    return _odd_product(lo, mid) * _odd_product(mid, hi)
+
+def factorial_fast(n: int) -> int:
+    """Factorial by binary splitting of odd factors.
+    n! is 2**(n - popcount(n)) times the product, over k, of the odd numbers
+    in (n >> (k+1), n >> k] raised to the power k+1; the powers come from
+    multiplying the running product p into r once per level.
+    Small n come from a cached table. Raises ValueError for negative inputs.
+    """
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    if n < len(_SMALL_FACTORIALS):
+        return _SMALL_FACTORIALS[n]
+    p = r = 1
+    for k in range(n.bit_length() - 1, -1, -1):
+        p *= _odd_product(n >> (k + 1), n >> k)
+        r *= p
+    return r << (n - bin(n).count("1"))
+
+def _range_product_mod(lo: int, hi: int, m: int) -> int:
+    """Product of lo..hi-1 modulo m, reducing once per _MOD_CHUNK factors."""
+    result = 1 % m
+    for start in range(lo, hi, _MOD_CHUNK):
+        result = result * math.prod(range(start, min(start + _MOD_CHUNK, hi))) % m
+    return result
+
+def factorial_mod(n: int, m: int) -> int:
+    """Return n! mod m without building n!.
+    n! is 0 mod m as soon as n >= m, so huge n cost nothing. For a prime
+    modulus, Wilson's theorem ((m-1)! = -1 mod m) lets n! be computed from
+    whichever of 1..n or n+1..m-1 is shorter.
+    Raises ValueError for negative n or m < 1.
+    """
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    if m < 1:
+        raise ValueError("modulus must be a positive integer")
+    if n >= m:
+        return 0
+    if 2 * n > m and is_prime(m):
+        # n! * (n+1)(n+2)...(m-1) = (m-1)! = -1 (mod m)
+        rest = _range_product_mod(n + 1, m, m)
+        return (m - pow(rest, -1, m)) % m
+    return _range_product_mod(2, n + 1, m)
+
+def benchmark_factorial(sizes=(100, 1_000, 10_000, 100_000, 1_000_000),
+                        iterative_limit: int = 100_000) -> None:
+    """Time factorial_fast against math.factorial and the two simple versions.
+    factorial_iterative is skipped above iterative_limit because it is slow.
+    """
+    print("=" * 78)
+    print("FACTORIAL BENCHMARK (seconds)")
+    print("=" * 78)
+    print(f"{'n':>10} {'math':>12} {'fast':>12} {'iterative':>12} {'recursive':>24}")
+    for n in sizes:
+        start = time.perf_counter()
+        expected = math.factorial(n)
+        t_math = time.perf_counter() - start
+        start = time.perf_counter()
+        fast = factorial_fast(n)
+        t_fast = time.perf_counter() - start
+        if fast != expected:
+            raise AssertionError(f"factorial_fast({n}) is wrong")
+        if n <= iterative_limit:
+            start = time.perf_counter()
+            factorial_iterative(n)
+            t_iter = f"{time.perf_counter() - start:>12.4f}"
+        else:
+            t_iter = f"{'skipped':>12}"
+        try:
+            start = time.perf_counter()
+            factorial_recursive(n)
+            t_rec = f"{time.perf_counter() - start:>24.4f}"
+        except RecursionError:
+            t_rec = f"{'RecursionError':>24}"
+        print(f"{n:>10} {t_math:>12.4f} {t_fast:>12.4f} {t_iter} {t_rec}")
+
 if __name__ == "__main__":
     try:
-        s = input("Enter a non-negative integer to compute factorial: ").strip()
-        n = int(s)
-        if n < 0:
-            print("Invalid input: please enter a non-negative integer.")
+        choice = input("1. Compute a factorial\n2. Compute a factorial modulo m\n3. Run benchmark\nEnter choice (1-3): ").strip()
+        if choice == "1":
+            s = input("Enter a non-negative integer to compute factorial: ").strip()
+            n = int(s)
+            if n < 0:
+                print("Invalid input: please enter a non-negative integer.")
+            else:
+                try:
+                    rec = factorial_recursive(n)
+                except RecursionError:
+                    rec = "RecursionError (too deep)"
+                itr = factorial_iterative(n)
+                print(f"{n}! (recursive) = {rec}")
+                print(f"{n}! (iterative) = {itr}")
+        elif choice == "2":
+            n = int(input("Enter a non-negative integer n: ").strip())
+            m = int(input("Enter the modulus m: ").strip())
+            print(f"{n}! mod {m} = {factorial_mod(n, m)}")
+        elif choice == "3":
+            benchmark_factorial()
         else:
-            try:
-                rec = factorial_recursive(n)
-            except RecursionError:
-                rec = "RecursionError (too deep)"
-            itr = factorial_iterative(n)
-            print(f"{n}! (recursive) = {rec}")
-            print(f"{n}! (iterative) = {itr}")
+            print("Invalid choice!")
     except ValueError:
         print("Invalid input: please enter a valid integer.")
 # ...existing code...
\ No newline at end of file
@@ -1,12 +1,17 @@
 # ...existing code...
 
-def find_largest(numbers: list[float]) -> float:
-    """Return the largest number from numbers.
-    Raises ValueError if the list is empty.
+from collections.abc import Iterable
+
+_EMPTY = object()
+
+def find_largest(numbers: Iterable[float]) -> float:
+    """Return the largest number from numbers (a list or any iterable, including generators).
+    Raises ValueError if there are no numbers.
     """
-    if not numbers:
+    largest = max(numbers, default=_EMPTY)
+    if largest is _EMPTY:
         raise ValueError("empty list")
-    return max(numbers)
+    return largest
 
 if __name__ == "__main__":
     try:
@@ -1,4 +1,237 @@
 # ...existing code...
+from bisect import bisect_left
+from collections.abc import Sized
+import heapq
+import itertools
+import math
+from operator import mul, sub
+import random
+import time
+UPDATE_BATCH = 65536  # scores taken from an iterator at a time by the streaming updates
+class ScoreStats:
+    """Single-pass running statistics: count, sum, mean, min, max and variance.
+    add() uses Welford's update; update() summarises batches with C-level
+    builtins and folds them in with Chan's formula, so either stays accurate
+    over long streams. Accumulators built over separate chunks can be
+    combined with merge().
+    """
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._mean = 0.0   # running mean for Welford's method
+        self._m2 = 0.0     # sum of squared deviations from the running mean
+    def add(self, score):
+        """Fold one score into the statistics."""
+        self.count += 1
+        self.total += score
+        if score < self.minimum:
+            self.minimum = score
+        if score > self.maximum:
+            self.maximum = score
+        delta = score - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (score - self._mean)
+    def update(self, scores):
+        """Fold every score from any iterable, UPDATE_BATCH at a time; returns self."""
+        scores = iter(scores)
+        while batch := list(itertools.islice(scores, UPDATE_BATCH)):
+            n = len(batch)
+            total = math.fsum(batch)
+            mean = total / n
+            deviations = list(map(sub, batch, itertools.repeat(mean, n)))
+            self._merge_parts(n, total, mean, sum(map(mul, deviations, deviations)), min(batch), max(batch))
+        return self
+    def _merge_parts(self, count, total, mean, m2, minimum, maximum):
+        """Fold a summarised group of scores into this one (Chan's parallel formula)."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self._mean, self._m2 = count, total, mean, m2
+            self.minimum, self.maximum = minimum, maximum
+            return
+        combined = self.count + count
+        delta = mean - self._mean
+        self._m2 += m2 + delta * delta * self.count * count / combined
+        self._mean += delta * count / combined
+        self.count = combined
+        self.total += total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+    def merge(self, other):
+        """Combine another accumulator into this one (Chan's parallel formula); returns self."""
+        self._merge_parts(other.count, other.total, other._mean, other._m2, other.minimum, other.maximum)
+        return self
+    @property
+    def mean(self):
+        """Average score (raises ValueError if empty)."""
+        if self.count == 0:
+            raise ValueError("No scores provided.")
+        return self.total / self.count
+    @property
+    def variance(self):
+        """Population variance (raises ValueError if empty)."""
+        if self.count == 0:
+            raise ValueError("No scores provided.")
+        return self._m2 / self.count
+    @property
+    def sample_variance(self):
+        """Sample variance with Bessel's correction (raises ValueError with fewer than two scores)."""
+        if self.count < 2:
+            raise ValueError("At least two scores are needed.")
+        return self._m2 / (self.count - 1)
+    @classmethod
+    def from_file(cls, path):
+        """Build statistics from a file of comma-separated scores, one line at a time."""
+        with open(path, encoding="utf-8") as f:
+            return cls().update(iter_scores(f))
+class QuantileSketch:
+    """Mergeable KLL sketch for approximate quantiles (median, p95, p99, ...).
+    Accuracy: a quantile's rank is off by about 1.7/k of the stream length
+    (about 1% for the default k=200) with high probability, whatever the
+    stream length or value distribution.
+    Memory: about 3*k retained values plus one list per level (log2 of the
+    stream length / k levels), so a few thousand floats for k=200.
+    """
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.levels = [[]]        # levels[h] holds values of weight 2**h
+        self._rng = random.Random(seed)
+        self._capacity_total = self._capacity(0)
+    def _capacity(self, h):
+        """Room at level h; lower levels get geometrically less (factor 2/3)."""
+        depth = len(self.levels) - h - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+    def _retained(self):
+        return sum(len(level) for level in self.levels)
+    def _compress(self):
+        """Halve full levels by keeping every other sorted value, promoted one level up."""
+        for h in range(len(self.levels)):
+            level = self.levels[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._capacity_total = sum(self._capacity(i) for i in range(len(self.levels)))
+                level.sort()
+                keep_odd = len(level) % 2
+                leftover = [level.pop()] if keep_odd else []
+                self.levels[h + 1].extend(level[self._rng.randrange(2)::2])
+                self.levels[h] = leftover
+                if self._retained() < self._capacity_total:
+                    break
+    def add(self, score):
+        """Fold one score into the sketch."""
+        self.levels[0].append(score)
+        self.count += 1
+        if self._retained() >= self._capacity_total:
+            self._compress()
+    def update(self, scores):
+        """Fold every score from any iterable, in batches; returns self."""
+        scores = iter(scores)
+        while True:
+            room = max(self._capacity_total - self._retained(), 1)
+            batch = list(itertools.islice(scores, room))
+            if not batch:
+                return self
+            self.levels[0].extend(batch)
+            self.count += len(batch)
+            if self._retained() >= self._capacity_total:
+                self._compress()
+    def merge(self, other):
+        """Combine another sketch into this one; returns self."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        self._capacity_total = sum(self._capacity(i) for i in range(len(self.levels)))
+        for h, level in enumerate(other.levels):
+            self.levels[h].extend(level)
+        self.count += other.count
+        while self._retained() >= self._capacity_total:
+            self._compress()
+        return self
+    def quantiles(self, qs):
+        """Approximate values at each fraction in qs (0 <= q <= 1)."""
+        if self.count == 0:
+            raise ValueError("No scores provided.")
+        weighted = sorted((v, 1 << h) for h, level in enumerate(self.levels) for v in level)
+        total = sum(w for _, w in weighted)
+        cumulative = list(itertools.accumulate(w for _, w in weighted))
+        result = []
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Quantiles must be between 0 and 1.")
+            i = min(bisect_left(cumulative, q * total), len(weighted) - 1)
+            result.append(weighted[i][0])
+        return result
+    def quantile(self, q):
+        """Approximate value at fraction q (0.5 is the median)."""
+        return self.quantiles([q])[0]
+class TopKScores:
+    """Mergeable exact top-k: keeps only the k largest scores seen (O(k) memory)."""
+    def __init__(self, k=10):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self._heap = []   # min-heap of the current top k
+    def add(self, score):
+        """Fold one score in."""
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, score)
+        elif score > self._heap[0]:
+            heapq.heapreplace(self._heap, score)
+    def update(self, scores, batch=UPDATE_BATCH):
+        """Fold every score from any iterable, batch by batch; returns self."""
+        scores = iter(scores)
+        while True:
+            chunk = list(itertools.islice(scores, batch))
+            if not chunk:
+                return self
+            self._heap = heapq.nlargest(self.k, itertools.chain(self._heap, chunk))
+            heapq.heapify(self._heap)
+    def merge(self, other):
+        """Combine another TopKScores into this one; returns self."""
+        self._heap = heapq.nlargest(self.k, itertools.chain(self._heap, other._heap))
+        heapq.heapify(self._heap)
+        return self
+    def result(self):
+        """Return the top scores, highest first."""
+        return sorted(self._heap, reverse=True)
+def sketch_scores(lines, k=200, top=10):
+    """Parse comma-separated lines (like parse_scores) into ScoreStats, QuantileSketch and TopKScores in one pass."""
+    stats, sketch, best = ScoreStats(), QuantileSketch(k), TopKScores(top)
+    scores = iter_scores(lines)
+    while True:
+        batch = list(itertools.islice(scores, UPDATE_BATCH))
+        if not batch:
+            return stats, sketch, best
+        stats.update(batch)
+        sketch.update(batch)
+        best.update(batch)
+def benchmark_sketches(n=1_000_000, qs=(0.5, 0.95, 0.99), k=200):
+    """Compare the sketches with exact sorting on n random scores: time, rank error and memory."""
+    scores = [random.gauss(70, 12) for _ in range(n)]
+    print("=" * 60)
+    print(f"QUANTILE SKETCH BENCHMARK ({n} scores, k={k})")
+    print("=" * 60)
+    start = time.perf_counter()
+    ordered = sorted(scores)
+    exact = [ordered[min(int(q * n), n - 1)] for q in qs]
+    exact_top = ordered[-10:][::-1]
+    t_sort = time.perf_counter() - start
+    start = time.perf_counter()
+    sketch = QuantileSketch(k).update(scores)
+    approx = sketch.quantiles(qs)
+    top = TopKScores(10).update(scores).result()
+    t_sketch = time.perf_counter() - start
+    print(f"Exact sort:  {t_sort:.3f} s, {n} values held")
+    print(f"Sketches:    {t_sketch:.3f} s, {sketch._retained()} values held")
+    for q, e, a in zip(qs, exact, approx):
+        rank_error = abs(bisect_left(ordered, a) - q * n) / n
+        print(f"  p{q * 100:g}: exact {e:.3f}, sketch {a:.3f}, rank error {rank_error:.4%}")
+    print(f"  top-10 exact match: {top == exact_top}")
 def sum_scores(scores):
     """Return the sum of scores."""
     return sum(scores)
@@ -18,14 +251,24 @@ def min_score(scores):
         raise ValueError("No scores provided.")
     return min(scores)
 def process_scores(scores):
-    """Compute and return average, highest and lowest as a tuple."""
-    return average_score(scores), max_score(scores), min_score(scores)
+    """Compute and return average, highest and lowest as a tuple.
+    Sized collections go through the builtins; other iterables, including
+    generators, are consumed once by a ScoreStats accumulator.
+    """
+    if isinstance(scores, Sized):
+        return average_score(scores), max_score(scores), min_score(scores)
+    stats = ScoreStats().update(scores)
+    return stats.mean, stats.maximum, stats.minimum
+def iter_scores(lines):
+    """Lazily parse comma-separated floats from an iterable of lines."""
+    for line in lines:
+        for p in line.split(","):
+            p = p.strip()
+            if p != "":
+                yield float(p)
 def parse_scores(input_str):
     """Parse a comma-separated string into a list of floats."""
-    parts = [p.strip() for p in input_str.split(",") if p.strip() != ""]
-    if not parts:
-        return []
-    return [float(p) for p in parts]
+    return list(iter_scores([input_str]))
 def main():
     print("=== Score Processor ===")
     raw = input("Enter scores (comma-separated): ").strip()
@@ -1,3 +1,8 @@
+
+import repo_root  # puts the repository root on sys.path
+from trampoline import run
+
+
 class Node:
     def __init__(self, data):
         self.data = data
@@ -14,13 +19,17 @@ class BinarySearchTree:
         self.root = self._insert_recursive(self.root, data)
 
     def _insert_recursive(self, root, data):
+        return run(self._insert_steps(root, data))
+
+    def _insert_steps(self, root, data):
+        """Generator form of _insert_recursive, driven by trampoline.run."""
         if root is None:
             return Node(data)
 
         if data < root.data:
-            root.left = self._insert_recursive(root.left, data)
+            root.left = yield self._insert_steps(root.left, data)
         else:
-            root.right = self._insert_recursive(root.right, data)
+            root.right = yield self._insert_steps(root.right, data)
 
         return root
 
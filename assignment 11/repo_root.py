@@ -0,0 +1,10 @@
+# Importing this module puts the repository root on sys.path, so the shared
+# helpers kept there (trampoline, factoring, compressed_io, shape_batch) can be
+# imported by the scripts in this folder.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -1,6 +1,9 @@
 import math
 import sys
 
+import repo_root  # puts the repository root on sys.path
+from shape_batch import ShapeRegistry
+
 # --- Calculation Logic ---
 
 def area_rectangle(length, width):
@@ -17,12 +20,25 @@ def area_circle(radius):
     # Using math.pi instead of the hardcoded 3.14 for precision
     return math.pi * radius * radius
 
+# Batch areas: each shape is registered with its scalar function and a kernel
+# that takes whole NumPy columns. These formulas are plain arithmetic, so the
+# scalar functions already work element-wise on arrays and serve as kernels.
+SHAPES = ShapeRegistry()
+SHAPES.register("rectangle", area_rectangle, area_rectangle, dimensions=2)
+SHAPES.register("square", area_square, area_square, dimensions=1)
+SHAPES.register("circle", area_circle, area_circle, dimensions=1)
+
 # Map shape names to their corresponding functions
-SHAPE_CALCULATORS = {
-    "rectangle": area_rectangle,
-    "square": area_square,
-    "circle": area_circle
-}
+SHAPE_CALCULATORS = SHAPES.scalars
+
+def batch_areas(kinds, *dimensions):
+    """Calculates the areas of many shapes at once.
+
+    kinds lists one shape name per row; dimensions are columns of the first,
+    second, ... dimension of every row (length and width for a rectangle,
+    side or radius for the others). Returns the areas in input order.
+    """
+    return SHAPES.areas(kinds, *dimensions)
 
 # --- User Input & Validation ---
 
@@ -1,8 +1,12 @@
 import sys
 
+import repo_root  # puts the repository root on sys.path
+from compressed_io import open_text
+
 def safe_read_file(filename):
     """
     Safely reads the content of a file using a context manager.
+    gzip, bz2 and xz files are decompressed transparently.
 
     Args:
         filename (str): The path to the file to read.
@@ -16,7 +20,7 @@ def safe_read_file(filename):
     # Using 'with open(...) as f:' is the best practice.
     # It automatically handles closing the file (f.close()) even if errors occur.
     try:
-        with open(filename, "r", encoding="utf-8") as f:
+        with open_text(filename, encoding="utf-8") as f:
             file_content = f.read()
         print("✅ File successfully read.")
         
@@ -0,0 +1,290 @@
+import json
+import math
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from task1 import CHUNK_SIZE, ColumnStats, calculate_column_statistics, iter_chunks, np, statistics_from_chunks
+
+# File layout (one sidecar file per CSV column), modelled on .npy:
+#   7-byte magic, 1-byte version, 4-byte little-endian header length,
+#   a JSON header padded with spaces so the data starts on a 64-byte boundary,
+#   the numeric cells as little-endian float64 (count values, nulls left out),
+#   then one bit per row, least significant bit first, set when the row held
+#   a number.
+MAGIC = b"\x93CSVCOL"
+VERSION = 1
+PREFIX = struct.Struct("<7sBI")
+ALIGNMENT = 64
+
+def cache_path(filename: str, column: int, cache_dir: str | None = None) -> str:
+    """Return the sidecar path used for one column of filename."""
+    name = f"{os.path.basename(filename)}.col{column}.cache"
+    return os.path.join(cache_dir or os.path.dirname(os.path.abspath(filename)), name)
+
+def _source_key(filename: str, column: int) -> dict:
+    """Identify the exact version of the source file a cache was built from."""
+    info = os.stat(filename)
+    return {'source': os.path.abspath(filename), 'size': info.st_size,
+            'mtime_ns': info.st_mtime_ns, 'column': column}
+
+# Header written with the widest possible values, so the real header always
+# fits in the room reserved for it before the values are streamed out.
+_WIDEST_FLOAT = -2.2250738585072014e-308
+_WIDEST_COUNT = 10 ** 19
+
+# Maps a 0/1 flag byte to the ASCII digit used by int(..., 2).
+_FLAG_TO_DIGIT = bytes.maketrans(b"\x00\x01", b"01")
+
+def _pack_bits(flags: bytes) -> bytes:
+    """Pack a run of 0/1 flag bytes (length divisible by 8) into bits, LSB first."""
+    if not flags:
+        return b""
+    return int(flags.translate(_FLAG_TO_DIGIT)[::-1], 2).to_bytes(len(flags) // 8, "little")
+
+def _encode_header(header: dict, room: int | None = None) -> bytes:
+    """JSON-encode header, padded with spaces to room bytes or to the data alignment."""
+    text = json.dumps(header).encode('ascii')
+    if room is None:
+        return text + b' ' * (-(PREFIX.size + len(text)) % ALIGNMENT)
+    return text + b' ' * (room - len(text))
+
+class _ColumnWriter:
+    """Streams one column's values and validity bits into a cache file, chunk by chunk.
+
+    Values go straight into the final file after a header-sized gap; the bits
+    go to a side file that is appended at the end, when the header (with the
+    column's statistics) is filled in and the file is renamed into place.
+    """
+
+    def __init__(self, path: str, key: dict) -> None:
+        self.path, self.key = path, key
+        self.tmp_path = f"{path}.tmp{os.getpid()}"
+        widest = dict(key, rows=_WIDEST_COUNT, count=_WIDEST_COUNT, nulls=_WIDEST_COUNT,
+                      bad=_WIDEST_COUNT, dtype='<f8', total=_WIDEST_FLOAT, min=_WIDEST_FLOAT,
+                      max=_WIDEST_FLOAT, m2=_WIDEST_FLOAT)
+        self.room = len(_encode_header(widest))
+        self.data = open(self.tmp_path, 'wb')
+        self.data.seek(PREFIX.size + self.room)
+        self.bits = tempfile.TemporaryFile()
+        self.pending = bytearray()
+
+    def write(self, values, valid) -> None:
+        """Append one chunk: its float values and one 0/1 flag per row (None: all valid)."""
+        if np is not None and isinstance(values, np.ndarray):
+            self.data.write(values.astype('<f8', copy=False).tobytes())
+        else:
+            values = array('d', values)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            values.tofile(self.data)
+        self.pending += b"\x01" * len(values) if valid is None else valid
+        whole = len(self.pending) - len(self.pending) % 8
+        self.bits.write(_pack_bits(bytes(self.pending[:whole])))
+        del self.pending[:whole]
+
+    def finish(self, stats: ColumnStats) -> None:
+        """Append the bitmap, write the header and move the file into place."""
+        if self.pending:
+            self.pending += bytes(-len(self.pending) % 8)
+            self.bits.write(_pack_bits(bytes(self.pending)))
+        self.bits.seek(0)
+        shutil.copyfileobj(self.bits, self.data)
+        header = dict(self.key, rows=stats.count + stats.nulls + stats.bad, count=stats.count,
+                      nulls=stats.nulls, bad=stats.bad, dtype='<f8', total=stats.total,
+                      min=stats.min, max=stats.max, m2=stats.m2)
+        self.data.seek(0)
+        self.data.write(PREFIX.pack(MAGIC, VERSION, self.room))
+        self.data.write(_encode_header(header, self.room))
+        self.close()
+        os.replace(self.tmp_path, self.path)
+
+    def close(self) -> None:
+        """Close both files (the temporary cache file is left for finish or abort)."""
+        self.data.close()
+        self.bits.close()
+
+    def abort(self) -> None:
+        """Discard a partly written cache."""
+        self.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def build_cache(filename: str, columns=(0,), cache_dir: str | None = None,
+                chunk_size: int = CHUNK_SIZE) -> None:
+    """Parse filename once and write a cache file for every column in columns.
+
+    Parsing goes through statistics_from_chunks, so rows are counted the
+    same way (blank lines are skipped); each chunk's values and validity
+    bits are written out as soon as it is parsed, so memory stays bounded
+    by the chunk size. Empty cells are nulls and non-numeric cells are 'bad';
+    neither is stored in the value array, and both leave their row's bit clear.
+    """
+    keys = {c: _source_key(filename, c) for c in columns}
+    writers = {}
+    try:
+        for c in columns:
+            writers[c] = _ColumnWriter(cache_path(filename, c, cache_dir), keys[c])
+        stats = statistics_from_chunks(iter_chunks(filename, chunk_size), columns, skip_bad=True,
+                                       sink=lambda c, values, valid: writers[c].write(values, valid))
+        for c in columns:
+            writers.pop(c).finish(stats[c])
+    finally:
+        for writer in writers.values():
+            writer.abort()
+
+class CachedColumn:
+    """Read-only, memory-mapped view of one column cache file.
+
+    values is a NumPy array when NumPy is installed and a float memoryview
+    otherwise; both point straight into the mapped file, so opening a cache
+    copies nothing. valid is the per-row bitmap.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, length = PREFIX.unpack_from(self._map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError
+            self.header = json.loads(self._map[PREFIX.size:PREFIX.size + length])
+        except (struct.error, ValueError):
+            self._map.close()
+            raise ValueError(f"{path} is not a column cache file")
+        offset = PREFIX.size + length
+        count = self.header['count']
+        if np is not None:
+            self.values = np.frombuffer(self._map, dtype='<f8', count=count, offset=offset)
+        elif sys.byteorder == 'little':
+            self.values = memoryview(self._map)[offset:offset + 8 * count].cast('d')
+        else:
+            self.values = array('d', self._map[offset:offset + 8 * count])
+            self.values.byteswap()
+        self.valid = memoryview(self._map)[offset + 8 * count:]
+
+    def matches(self, key: dict) -> bool:
+        """Return True if the cache was built from the source file described by key."""
+        return all(self.header.get(name) == value for name, value in key.items())
+
+    def statistics(self) -> ColumnStats:
+        """Return the column's statistics from the aggregates stored in the header."""
+        h = self.header
+        stats = ColumnStats()
+        stats.merge_parts(h['count'], h['total'], h['min'], h['max'], h['m2'])
+        stats.nulls = h['nulls']
+        stats.bad = h['bad']
+        return stats
+
+    def close(self) -> None:
+        """Release the memory map.
+
+        If the caller still holds values or valid (or a slice of them), the
+        map cannot be unmapped yet; it then stays open until the last of
+        those views is garbage-collected, so they keep working.
+        """
+        self.values = self.valid = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def open_column(filename: str, column: int = 0, cache_dir: str | None = None) -> CachedColumn:
+    """Return the cached column, rebuilding the cache first if it is missing or stale.
+
+    A cache is stale when the source's path, size or modification time no
+    longer match the ones recorded when it was built.
+    """
+    try:
+        key = _source_key(filename, column)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File {filename} not found.")
+    path = cache_path(filename, column, cache_dir)
+    try:
+        cached = CachedColumn(path)
+        if cached.matches(key):
+            return cached
+        cached.close()
+    except (FileNotFoundError, ValueError):
+        pass
+    build_cache(filename, (column,), cache_dir)
+    return CachedColumn(path)
+
+def cached_column_statistics(filename: str, columns=(0,), skip_bad: bool = False,
+                             cache_dir: str | None = None) -> dict[int, dict]:
+    """Cached version of calculate_column_statistics.
+
+    The first call parses the CSV and writes one sidecar cache per column;
+    later calls only read the aggregates stored in those files' headers,
+    until the CSV changes.
+    """
+    try:
+        keys = {c: _source_key(filename, c) for c in columns}
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File {filename} not found.")
+    stale = []
+    for c in columns:
+        try:
+            with CachedColumn(cache_path(filename, c, cache_dir)) as cached:
+                if not cached.matches(keys[c]):
+                    stale.append(c)
+        except (FileNotFoundError, ValueError):
+            stale.append(c)
+    if stale:
+        build_cache(filename, stale, cache_dir)
+    result = {}
+    for c in columns:
+        with CachedColumn(cache_path(filename, c, cache_dir)) as cached:
+            stats = cached.statistics()
+        if stats.bad and not skip_bad:
+            raise ValueError("Non-numeric data found in the file.")
+        result[c] = stats.result()
+    return result
+
+def benchmark_cache(rows: int = 1_000_000) -> None:
+    """Time a plain parse against cold (building) and warm cached statistics."""
+    print("=" * 60)
+    print(f"COLUMN CACHE BENCHMARK ({rows} rows)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        with open(path, "w") as f:
+            for _ in range(rows):
+                f.write(f"{random.uniform(-1e6, 1e6)!r},{random.randint(0, 99)}\n")
+        start = time.perf_counter()
+        plain = calculate_column_statistics(path)[0]
+        print(f"Parse CSV:          {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        cached_column_statistics(path)
+        print(f"Build cache:        {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        warm = cached_column_statistics(path)[0]
+        print(f"Warm cache:         {time.perf_counter() - start:8.3f} s")
+        if warm['count'] != plain['count'] or not math.isclose(warm['mean'], plain['mean'], abs_tol=1e-6):
+            raise AssertionError("cached statistics differ from a plain parse")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Calculate statistics with the cache\n2. Run cache benchmark\nEnter choice (1-2): ").strip()
+        if choice == "1":
+            filename = input("Enter the CSV file path: ").strip()
+            stats = cached_column_statistics(filename)[0]
+            print(f"Mean: {stats['mean']}, Min: {stats['min']}, Max: {stats['max']}")
+        elif choice == "2":
+            benchmark_cache()
+        else:
+            print("Invalid choice!")
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
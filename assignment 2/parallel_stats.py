@@ -0,0 +1,124 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import repo_root  # puts the repository root on sys.path
+from compressed_io import sniff_format
+from task1 import CHUNK_SIZE, ColumnStats, iter_chunks, statistics_from_chunks
+
+# Files larger than this are split into byte ranges of about this size.
+RANGE_SIZE = 256 * 1024 * 1024
+
+def split_ranges(filename: str, range_size: int = RANGE_SIZE) -> list[tuple[int, int]]:
+    """Split a file into (start, end) byte ranges of about range_size that end on row boundaries.
+    Compressed files cannot be entered mid-stream, so they come back as a single (0, None) range.
+    """
+    size = os.path.getsize(filename)
+    if sniff_format(filename):
+        return [(0, None)]
+    bounds = [0]
+    with open(filename, 'rb') as f:
+        pos = range_size
+        while pos < size:
+            f.seek(pos)
+            f.readline()  # move to the start of the next row
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            bounds.append(boundary)
+            pos = boundary + range_size
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+def _range_partials(task) -> tuple[int, dict[int, tuple]]:
+    """Worker: aggregate one byte range and return (its share of the file size, compact per-column partials)."""
+    filename, start, end, weight, columns, skip_bad, chunk_size = task
+    stats = statistics_from_chunks(iter_chunks(filename, chunk_size, start, end), columns, skip_bad)
+    partials = {c: (s.count, s.total, s.min, s.max, s.m2, s.nulls, s.bad) for c, s in stats.items()}
+    return weight, partials
+
+def parallel_statistics(filenames, columns=(0,), skip_bad: bool = False, workers: int | None = None,
+                        range_size: int = RANGE_SIZE, chunk_size: int = CHUNK_SIZE,
+                        progress=None) -> dict[int, dict]:
+    """Compute column statistics over many CSV files (and byte ranges of large ones) in a process pool.
+
+    Each worker returns only (count, sum, min, max, M2, nulls, bad) per
+    column. The driver merges the partials in task order, and the column
+    sums with math.fsum, so the result never depends on which worker
+    finished first. progress, if given, is called as
+    progress(bytes_done, bytes_total) as each range finishes.
+    """
+    tasks = []
+    for filename in filenames:
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"File {filename} not found.")
+        for start, end in split_ranges(filename, range_size):
+            weight = os.path.getsize(filename) if end is None else end - start
+            tasks.append((filename, start, end, weight, tuple(columns), skip_bad, chunk_size))
+    total_bytes = sum(task[3] for task in tasks)
+    done_bytes = 0
+    lock = threading.Lock()
+
+    def report(future) -> None:
+        nonlocal done_bytes
+        if future.cancelled() or future.exception() is not None:
+            return
+        with lock:
+            done_bytes += future.result()[0]
+            progress(done_bytes, total_bytes)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_range_partials, task) for task in tasks]
+        if progress is not None:
+            for future in futures:
+                future.add_done_callback(report)
+        results = [future.result()[1] for future in futures]
+    merged = {}
+    for c in columns:
+        merged[c] = ColumnStats()
+        for partials in results:
+            count, total, low, high, m2, nulls, bad = partials[c]
+            merged[c].merge_parts(count, total, low, high, m2)
+            merged[c].nulls += nulls
+            merged[c].bad += bad
+        merged[c].total = math.fsum(partials[c][1] for partials in results)
+    return {c: s.result() for c, s in merged.items()}
+
+def print_progress(done: int, total: int) -> None:
+    """Progress callback that prints a one-line percentage."""
+    percent = 100 * done / total if total else 100
+    print(f"\rProcessed {done / 1e6:.1f} of {total / 1e6:.1f} MB ({percent:.0f}%)", end="", flush=True)
+    if done >= total:
+        print()
+
+def benchmark_scaling(filenames, worker_counts=None, columns=(0,), range_size: int = RANGE_SIZE) -> None:
+    """Time parallel_statistics with increasing worker counts on the same files."""
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    print("=" * 60)
+    print("CSV STATISTICS SCALING BENCHMARK")
+    print("=" * 60)
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        parallel_statistics(filenames, columns, workers=workers, range_size=range_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers: {elapsed:8.3f} s  (speed-up {baseline / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Calculate statistics for CSV files\n2. Run scaling benchmark\nEnter choice (1-2): ").strip()
+        paths = input("Enter CSV file paths separated by spaces: ").split()
+        if choice == "1":
+            stats = parallel_statistics(paths, progress=print_progress)[0]
+            print(f"Mean: {stats['mean']}, Min: {stats['min']}, Max: {stats['max']}")
+        elif choice == "2":
+            benchmark_scaling(paths)
+        else:
+            print("Invalid choice!")
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
@@ -0,0 +1,126 @@
+import json
+import os
+import time
+
+import repo_root  # puts the repository root on sys.path
+from compressed_io import sniff_format
+from task1 import CHUNK_SIZE, ColumnStats, iter_chunks, statistics_from_chunks
+
+# How far back from the end of the file to look for the last newline at a time.
+_TAIL_BLOCK = 64 * 1024
+
+def checkpoint_path(filename: str) -> str:
+    """Return the default checkpoint path for filename."""
+    return f"{filename}.checkpoint"
+
+def _last_row_end(f, lo: int, hi: int) -> int:
+    """Return the offset just past the last newline in [lo, hi), or lo if there is none."""
+    pos = hi
+    while pos > lo:
+        start = max(lo, pos - _TAIL_BLOCK)
+        f.seek(start)
+        block = f.read(pos - start)
+        cut = block.rfind(b'\n')
+        if cut >= 0:
+            return start + cut + 1
+        pos = start
+    return lo
+
+def load_checkpoint(path: str, columns) -> dict:
+    """Read a checkpoint, or return an empty one if it is missing or was made for other columns."""
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        state = None
+    if state is None or sorted(map(int, state['columns'])) != sorted(columns):
+        return {'inode': None, 'offset': 0, 'columns': {str(c): None for c in columns}}
+    return state
+
+def _save_checkpoint(path: str, state: dict) -> None:
+    """Write the checkpoint under a temporary name and rename it into place."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+def update_statistics(filename: str, columns=(0,), skip_bad: bool = False,
+                      checkpoint: str | None = None, chunk_size: int = CHUNK_SIZE) -> dict[int, dict]:
+    """Fold the rows appended to filename since the last call into its checkpoint.
+
+    The checkpoint holds the byte offset reached so far and each column's
+    (count, sum, min, max, M2, nulls, bad), so a call only parses the new
+    bytes. A trailing row without its newline is left for the next call.
+    If the file shrank or was replaced (new inode), it is read from the start.
+    Returns the statistics for the whole file, as calculate_column_statistics does.
+    """
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"File {filename} not found.")
+    if sniff_format(filename):
+        raise ValueError(f"{filename} is compressed; only plain files can be followed.")
+    checkpoint = checkpoint or checkpoint_path(filename)
+    state = load_checkpoint(checkpoint, columns)
+    info = os.stat(filename)
+    if state['inode'] != info.st_ino or info.st_size < state['offset']:
+        state = {'inode': info.st_ino, 'offset': 0, 'columns': {str(c): None for c in columns}}
+    merged = {}
+    for c in columns:
+        merged[c] = ColumnStats()
+        saved = state['columns'][str(c)]
+        if saved:
+            merged[c].merge_parts(saved['count'], saved['total'], saved['min'], saved['max'], saved['m2'])
+            merged[c].nulls, merged[c].bad = saved['nulls'], saved['bad']
+    with open(filename, 'rb') as f:
+        end = _last_row_end(f, state['offset'], info.st_size)
+    if end > state['offset']:
+        new = statistics_from_chunks(iter_chunks(filename, chunk_size, state['offset'], end),
+                                     columns, skip_bad)
+        for c in columns:
+            merged[c].merge(new[c])
+        state['offset'] = end
+        state['columns'] = {str(c): {'count': s.count, 'total': s.total, 'min': s.min, 'max': s.max,
+                                     'm2': s.m2, 'nulls': s.nulls, 'bad': s.bad}
+                            for c, s in merged.items()}
+        _save_checkpoint(checkpoint, state)
+    return {c: s.result() for c, s in merged.items()}
+
+def follow(filename: str, column: int = 0, interval: float = 1.0, skip_bad: bool = True,
+           checkpoint: str | None = None, max_updates: int | None = None) -> None:
+    """Print the column's statistics, then print them again whenever rows are appended.
+
+    Polls every interval seconds; each poll costs one stat() call, and an
+    update parses only the new rows. Stops after max_updates printed
+    updates, or on Ctrl+C.
+    """
+    last_size = last_stats = None
+    updates = 0
+    try:
+        while max_updates is None or updates < max_updates:
+            size = os.path.getsize(filename)
+            if size != last_size:
+                last_size = size
+                stats = update_statistics(filename, (column,), skip_bad, checkpoint)[column]
+                if stats == last_stats:
+                    continue  # only a partial row arrived
+                last_stats = stats
+                print(f"[{time.strftime('%H:%M:%S')}] Rows: {stats['count']}, Mean: {stats['mean']}, "
+                      f"Min: {stats['min']}, Max: {stats['max']}, Std: {stats['std']}")
+                updates += 1
+            else:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped following.")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Update statistics from the checkpoint\n2. Follow a growing file\nEnter choice (1-2): ").strip()
+        filename = input("Enter the CSV file path: ").strip()
+        if choice == "1":
+            stats = update_statistics(filename)[0]
+            print(f"Mean: {stats['mean']}, Min: {stats['min']}, Max: {stats['max']}")
+        elif choice == "2":
+            follow(filename)
+        else:
+            print("Invalid choice!")
+    except (FileNotFoundError, ValueError) as e:
+        print(e)
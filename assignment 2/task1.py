@@ -1,26 +1,225 @@
 # ...existing code...
 
 import csv
+import io
+import math
 import os
+from itertools import repeat
+from operator import itemgetter, mul, sub
 
-def calculate_statistics(filename: str) -> dict:
-    """Read a CSV file and calculate mean, min, and max of the numeric values in the first column."""
+import repo_root  # puts the repository root on sys.path
+from compressed_io import open_binary
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the engine falls back to plain Python parsing
+    np = None
+
+CHUNK_SIZE = 4 * 1024 * 1024  # bytes of CSV text parsed at a time
+
+class ColumnStats:
+    """Running statistics for one CSV column, built from parsed chunks.
+    Chunks are combined with Chan's parallel variance formula, so the result
+    is the same whichever way the file is split. With spread=False the
+    squared deviations (M2) are not computed and std is reported as None.
+    """
+
+    def __init__(self, spread: bool = True):
+        self.spread = spread
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.m2 = 0.0      # sum of squared deviations from the mean
+        self.nulls = 0     # empty or missing cells
+        self.bad = 0       # non-numeric cells that were skipped
+
+    def add_values(self, values) -> None:
+        """Fold a chunk of floats (a list or NumPy array) into the statistics."""
+        n = len(values)
+        if n == 0:
+            return
+        if np is not None and isinstance(values, np.ndarray):
+            total = float(values.sum())
+            low, high = float(values.min()), float(values.max())
+            m2 = float(((values - total / n) ** 2).sum()) if self.spread else 0.0
+        else:
+            total = math.fsum(values)
+            low, high = min(values), max(values)
+            m2 = 0.0
+            if self.spread:
+                # Deviations from the chunk mean, squared and summed by C-level map calls
+                deviations = list(map(sub, values, repeat(total / n, n)))
+                m2 = sum(map(mul, deviations, deviations))
+        self.merge_parts(n, total, low, high, m2)
+
+    def merge_parts(self, n: int, total: float, low: float, high: float, m2: float) -> None:
+        """Fold pre-aggregated (count, sum, min, max, M2) values into the statistics."""
+        if n == 0:
+            return
+        if self.count:
+            delta = total / n - self.total / self.count
+            self.m2 += m2 + delta * delta * self.count * n / (self.count + n)
+            self.min = min(self.min, low)
+            self.max = max(self.max, high)
+        else:
+            self.m2 = m2
+            self.min, self.max = low, high
+        self.count += n
+        self.total += total
+
+    def merge(self, other: "ColumnStats") -> None:
+        """Fold another ColumnStats (for example from another chunk of the file) into this one."""
+        self.merge_parts(other.count, other.total, other.min, other.max, other.m2)
+        self.nulls += other.nulls
+        self.bad += other.bad
+
+    def result(self) -> dict:
+        """Return the statistics as a dict (std is the population standard deviation)."""
+        if self.count == 0:
+            return {'count': 0, 'mean': None, 'min': None, 'max': None, 'std': None,
+                    'nulls': self.nulls, 'bad': self.bad}
+        return {
+            'count': self.count,
+            'mean': self.total / self.count,
+            'min': self.min,
+            'max': self.max,
+            'std': math.sqrt(self.m2 / self.count) if self.spread else None,
+            'nulls': self.nulls,
+            'bad': self.bad,
+        }
+
+def _pick_cells(text: str, columns) -> list:
+    """Split a chunk of CSV text into one sequence of cells per selected column.
+
+    Rows are parsed and reduced to the selected cells in a single pass, so
+    no per-row lists are kept; a chunk with a short row is parsed again and
+    padded with empty cells.
+    """
+    getter = itemgetter(*columns)
+    # newline='' splits rows only on \r and \n, as the csv module expects
     try:
-        with open(filename, mode='r', newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            values = [float(row[0]) for row in reader if row]  # Assuming numeric values are in the first column
+        picked = list(map(getter, filter(None, csv.reader(io.StringIO(text, newline='')))))
+    except IndexError:
+        picked = [getter(row + [''] * (max(columns) + 1 - len(row)))
+                  for row in csv.reader(io.StringIO(text, newline='')) if row]
+    if len(columns) == 1:
+        return [picked]
+    return list(zip(*picked)) or [()] * len(columns)
+
+def _parse_column(cells, stats: ColumnStats, skip_bad: bool):
+    """Convert one chunk of cells to floats, fold them into stats and return (values, valid).
+
+    valid is None when every cell held a number, otherwise a bytearray with
+    one 0/1 flag per cell. The common case is converted in one C-level
+    pass; only a chunk with an empty or bad cell is redone cell by cell.
+    """
+    try:
+        if np is not None:
+            values = np.asarray(cells, dtype=np.float64)
+        else:
+            values = list(map(float, cells))
+        stats.add_values(values)
+        return values, None
+    except ValueError:
+        pass  # at least one empty or bad cell: redo this chunk cell by cell
+    values = []
+    valid = bytearray(len(cells))
+    for i, cell in enumerate(cells):
+        if not cell.strip():
+            stats.nulls += 1
+            continue
+        try:
+            values.append(float(cell))
+        except ValueError:
+            if not skip_bad:
+                raise ValueError("Non-numeric data found in the file.")
+            stats.bad += 1
+            continue
+        valid[i] = 1
+    stats.add_values(values)
+    return values, valid
+
+def iter_chunks(filename: str, chunk_size: int = CHUNK_SIZE, start: int = 0, end: int | None = None):
+    """Yield decoded blocks of whole lines from filename, about chunk_size bytes each.
+    Only the bytes in [start, end) are read; start and end should fall on
+    row boundaries (see parallel_stats.split_ranges). gzip, bz2 and xz
+    files are decompressed on the fly, and the range then refers to the
+    decompressed bytes.
+    """
+    with open_binary(filename) as f:
+        if start:
+            f.seek(start)
+        remaining = None if end is None else end - start
+        carry = b''
+        while True:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            block = f.read(size) if size > 0 else b''
+            if remaining is not None:
+                remaining -= len(block)
+            if not block:
+                if carry:
+                    yield carry.decode('utf-8')
+                return
+            block = carry + block
+            cut = block.rfind(b'\n') + 1
+            if cut == 0:
+                carry = block
+                continue
+            carry = block[cut:]
+            yield block[:cut].decode('utf-8')
+
+def statistics_from_chunks(chunks, columns=(0,), skip_bad: bool = False,
+                           spread: bool = True, sink=None) -> dict[int, ColumnStats]:
+    """Build a ColumnStats for each column index from an iterable of text chunks.
+    sink, if given, is called as sink(column, values, valid) with each
+    chunk's parsed values (see _parse_column), e.g. to write them to disk.
+    """
+    stats = {c: ColumnStats(spread) for c in columns}
+    for text in chunks:
+        for (c, column_stats), cells in zip(stats.items(), _pick_cells(text, tuple(stats))):
+            values, valid = _parse_column(cells, column_stats, skip_bad)
+            if sink is not None:
+                sink(c, values, valid)
+    return stats
+
+def calculate_column_statistics(filename: str, columns=(0,), skip_bad: bool = False,
+                                chunk_size: int = CHUNK_SIZE, spread: bool = True) -> dict[int, dict]:
+    """Stream a CSV file and return mean, min, max, std and null counts for each selected column.
+    The file is read in chunk_size byte blocks split on row boundaries, so
+    memory stays flat however large the file is. Compressed files are
+    streamed without being unpacked to disk. Each chunk's columns are
+    parsed with NumPy when it is installed. Empty cells count as nulls;
+    non-numeric cells raise ValueError unless skip_bad is True, in which
+    case they are skipped and counted as 'bad'. Quoted fields may contain
+    commas but not newlines. spread=False skips the std calculation.
+    """
+    try:
+        stats = statistics_from_chunks(iter_chunks(filename, chunk_size), columns, skip_bad, spread)
     except FileNotFoundError:
         raise FileNotFoundError(f"File {filename} not found.")
-    except ValueError:
+    return {c: s.result() for c, s in stats.items()}
+
+def calculate_statistics(filename: str, use_cache: bool = False) -> dict:
+    """Read a CSV file and calculate mean, min, and max of the numeric values in the first column.
+    With use_cache=True the parsed column is kept in a sidecar cache file
+    (see column_cache.py) and reused until the CSV changes.
+    """
+    if use_cache:
+        from column_cache import cached_column_statistics  # imported here: column_cache imports this module
+        stats = cached_column_statistics(filename, columns=(0,), skip_bad=True)[0]
+    else:
+        stats = calculate_column_statistics(filename, columns=(0,), spread=False)[0]
+    if stats['nulls'] or stats['bad']:
         raise ValueError("Non-numeric data found in the file.")
     
-    if not values:
+    if not stats['count']:
         raise ValueError("No data to calculate statistics.")
     
     return {
-        'mean': sum(values) / len(values),
-        'min': min(values),
-        'max': max(values)
+        'mean': stats['mean'],
+        'min': stats['min'],
+        'max': stats['max']
     }
 
 if __name__ == "__main__":
@@ -2,6 +2,9 @@
 
 import math
 
+import repo_root  # puts the repository root on sys.path
+from shape_batch import ShapeRegistry
+
 def area_circle(radius: float) -> float:
     """Calculate the area of a circle given its radius."""
     return math.pi * (radius ** 2)  # Area = π * r^2
@@ -14,6 +17,17 @@ def area_triangle(base: float, height: float) -> float:
     """Calculate the area of a triangle given its base and height."""
     return 0.5 * base * height  # Area = 0.5 * base * height
 
+# Each shape's scalar function and vectorized kernel, registered side by side.
+# The formulas are plain arithmetic, so the functions work unchanged on NumPy arrays.
+AREA_FUNCTIONS = ShapeRegistry()
+AREA_FUNCTIONS.register("circle", area_circle, area_circle, dimensions=1)
+AREA_FUNCTIONS.register("rectangle", area_rectangle, area_rectangle, dimensions=2)
+AREA_FUNCTIONS.register("triangle", area_triangle, area_triangle, dimensions=2)
+
+def batch_areas(shapes, *dimensions):
+    """Calculate the areas of many shapes given as columns: shape names, then dimension columns."""
+    return AREA_FUNCTIONS.areas(shapes, *dimensions)  # Areas in input order
+
 if __name__ == "__main__":
     shape = input("Enter the shape (circle, rectangle, triangle) to calculate the area: ").strip().lower()
     
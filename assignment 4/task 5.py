@@ -1,6 +1,12 @@
+
+import repo_root  # puts the repository root on sys.path
+from compressed_io import open_text
+
 def count_lines(filename: str) -> int:
     """
     Count the number of lines in a text file.
+    gzip, bz2 and xz files are recognised by their first bytes and counted
+    while they are decompressed, without unpacking them to disk.
     
     Examples:
         count_lines("sample1.txt") -> 5    # File with 5 lines
@@ -11,7 +17,7 @@ def count_lines(filename: str) -> int:
         FileNotFoundError: If the file doesn't exist
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open_text(filename, encoding='utf-8') as file:
             return sum(1 for _ in file)
     except FileNotFoundError:
         raise FileNotFoundError(f"File '{filename}' not found")
@@ -1,33 +1,495 @@
 # ...existing code...
 
-def fib_recursive(n: int, trace: list | None = None) -> int:
+from abc import ABC, abstractmethod
+import functools
+import math
+from collections import deque
+import random
+import time
+
+import repo_root  # puts the repository root on sys.path
+from factoring import prime_factors
+from trampoline import run
+
+# Number of recent fib_fast results kept in memory. Only n up to
+# FIB_CACHE_MAX_N is cached (F(n) then has at most about 7 KB), so the cache
+# stays under a couple of MB; larger F(n) are recomputed on each call.
+FIB_CACHE_SIZE = 256
+FIB_CACHE_MAX_N = 80_000
+
+# Number of moduli whose Pisano periods are kept in memory.
+PISANO_CACHE_SIZE = 4096
+
+# fib_mod only reduces n by the Pisano period of m when n has more than this
+# many times as many bits as m; below that, doubling mod m directly is cheaper
+# than factoring m.
+PISANO_MIN_BIT_RATIO = 4
+
+def format_trace_event(event: str, n: int, value: int | None) -> str:
+    """Render a trace event the way fib_recursive has always printed it."""
+    if event == "call":
+        return f"call fib({n})"
+    return f"return fib({n}) -> {value}"
+
+class TraceSink(ABC):
+    """
+    Receives the (event, n, value) records of a traced fib_recursive call.
+    event is "call" (value None) or "return" (value is F(n)).
+
+    Args:
+        sample_every: keep only every k-th event that passes the depth filter.
+        max_depth: drop events from calls nested deeper than this (root = 0).
+
+    Subclasses must implement emit() (a subclass without it cannot be
+    instantiated); filtering happens in record(), before any string is built.
+    """
+
+    def __init__(self, sample_every: int = 1, max_depth: int | None = None) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be a positive integer")
+        self.sample_every = sample_every
+        self.max_depth = max_depth
+        self.seen = 0
+
+    def record(self, event: str, n: int, value: int | None, depth: int) -> None:
+        if self.max_depth is not None and depth > self.max_depth:
+            return
+        self.seen += 1
+        if (self.seen - 1) % self.sample_every == 0:
+            self.emit(event, n, value)
+
+    @abstractmethod
+    def emit(self, event: str, n: int, value: int | None) -> None:
+        """Handle one event that passed the sampling and depth filters."""
+
+class CallbackSink(TraceSink):
+    """Streams every kept event to callback(event, n, value)."""
+
+    def __init__(self, callback, sample_every: int = 1, max_depth: int | None = None) -> None:
+        super().__init__(sample_every, max_depth)
+        self.callback = callback
+
+    def emit(self, event, n, value):
+        self.callback(event, n, value)
+
+class FileSink(TraceSink):
+    """Writes each kept event as a line of text to an open file."""
+
+    def __init__(self, file, sample_every: int = 1, max_depth: int | None = None) -> None:
+        super().__init__(sample_every, max_depth)
+        self.file = file
+
+    def emit(self, event, n, value):
+        self.file.write(format_trace_event(event, n, value) + "\n")
+
+class RingBufferSink(TraceSink):
+    """Keeps only the most recent capacity events as (event, n, value) tuples."""
+
+    def __init__(self, capacity: int = 1000, sample_every: int = 1, max_depth: int | None = None) -> None:
+        super().__init__(sample_every, max_depth)
+        self.events = deque(maxlen=capacity)
+
+    def emit(self, event, n, value):
+        self.events.append((event, n, value))
+
+class _ListSink(TraceSink):
+    """Adapter for the original API: appends formatted strings to a list."""
+
+    def __init__(self, target: list) -> None:
+        super().__init__()
+        self.target = target
+
+    def emit(self, event, n, value):
+        self.target.append(format_trace_event(event, n, value))
+
+def fib_recursive(n: int, trace: "list | TraceSink | None" = None) -> int:
     """
     Calculate the nth Fibonacci number using recursion.
     Definition used: F(0) = 0, F(1) = 1, and for n >= 2: F(n) = F(n-1) + F(n-2).
 
     Args:
         n: non-negative integer index of the Fibonacci sequence.
-        trace: optional list to collect call/return steps for explanation.
+        trace: optional TraceSink (streaming callback, file writer or ring
+               buffer) or a plain list, which collects every call/return step
+               as a string for explanation.
 
     Returns:
         The nth Fibonacci number as an int.
     """
-    # Record the function call if trace is provided
-    if trace is not None:
-        trace.append(f"call fib({n})")
+    # Without a trace the recursion is unobservable, so use the closed-form solver
+    if trace is None and n >= 0:
+        return FIBONACCI.term(n)
+    sink = _ListSink(trace) if isinstance(trace, list) else trace
+    return run(_fib_steps(n, sink, 0))
+
+def _fib_steps(n: int, sink: TraceSink | None, depth: int):
+    """Generator form of fib_recursive, driven by trampoline.run."""
+    # Record the function call if a sink is provided
+    if sink is not None:
+        sink.record("call", n, None, depth)
 
     # Base cases: directly return for n == 0 or n == 1
     if n <= 1:
         result = n
     else:
         # Recursive step: sum of the two previous Fibonacci numbers
-        result = fib_recursive(n - 1, trace) + fib_recursive(n - 2, trace)
+        result = (yield _fib_steps(n - 1, sink, depth + 1)) + (yield _fib_steps(n - 2, sink, depth + 1))
 
-    # Record the return value if trace is provided
-    if trace is not None:
-        trace.append(f"return fib({n}) -> {result}")
+    # Record the return value if a sink is provided
+    if sink is not None:
+        sink.record("return", n, result, depth)
     return result
 
+def _fib_pair(n: int) -> tuple[int, int]:
+    """
+    Return (F(n), F(n+1)) by fast doubling over the bits of n.
+    Uses F(2k) = F(k) * (2*F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    so only O(log n) big-integer multiplications are needed.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+def _fib_single(n: int) -> int:
+    """Return F(n) for n >= 0; only F(n) is needed from the last doubling step."""
+    a, b = _fib_pair(n >> 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
+
+_fib_cached = functools.lru_cache(maxsize=FIB_CACHE_SIZE)(_fib_single)
+
+def fib_fast(n: int) -> int:
+    """
+    Calculate the nth Fibonacci number in O(log n) steps using fast doubling.
+    Results for the most recent FIB_CACHE_SIZE values of n up to
+    FIB_CACHE_MAX_N are memoized; bigger results are too large to keep.
+
+    Args:
+        n: non-negative integer index of the Fibonacci sequence.
+
+    Returns:
+        The nth Fibonacci number as an int.
+
+    Raises:
+        ValueError: if n is negative.
+    """
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+    if n <= FIB_CACHE_MAX_N:
+        return _fib_cached(n)
+    return _fib_single(n)
+
+def _fib_pair_mod(n: int, m: int) -> tuple[int, int]:
+    """Return (F(n) mod m, F(n+1) mod m) by fast doubling."""
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+def _shrink_period(candidate: int, m: int) -> int:
+    """Reduce a known period of the Fibonacci sequence mod m to the smallest one.
+
+    The true period divides candidate, so strip prime factors for as long as
+    the sequence still returns to (0, 1) after the shorter length.
+    """
+    period = candidate
+    for q in prime_factors(candidate):
+        while period % q == 0 and _fib_pair_mod(period // q, m) == (0, 1 % m):
+            period //= q
+    return period
+
+def _prime_power_period(p: int, k: int) -> int:
+    """Pisano period of p**k for a prime p."""
+    if p == 2:
+        base = 3
+    elif p == 5:
+        base = 20
+    elif p % 10 in (1, 9):
+        base = _shrink_period(p - 1, p)
+    else:
+        base = _shrink_period(2 * (p + 1), p)
+    if k == 1:
+        return base
+    # pi(p**k) divides pi(p) * p**(k-1)
+    return _shrink_period(base * p ** (k - 1), p ** k)
+
+@functools.lru_cache(maxsize=PISANO_CACHE_SIZE)
+def pisano_period(m: int) -> int:
+    """
+    Return the Pisano period of m: the length of the cycle of F(n) mod m.
+    m is factored and the periods of its prime powers are combined with lcm.
+
+    Raises:
+        ValueError: if m is not a positive integer.
+    """
+    if m < 1:
+        raise ValueError("m must be a positive integer")
+    period = 1
+    for p, k in prime_factors(m).items():
+        period = math.lcm(period, _prime_power_period(p, k))
+    return period
+
+def _worth_reducing(n: int, m: int) -> bool:
+    """True when n is so much larger than m that reducing it by pisano_period(m) pays off."""
+    return n.bit_length() > PISANO_MIN_BIT_RATIO * m.bit_length()
+
+def fib_mod(n: int, m: int) -> int:
+    """
+    Calculate F(n) mod m for arbitrarily large n.
+    When n is much larger than m, n is first reduced modulo the (cached)
+    Pisano period of m; the remaining index is handled by fast doubling mod m.
+
+    Raises:
+        ValueError: if n is negative or m is not a positive integer.
+    """
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+    if m < 1:
+        raise ValueError("m must be a positive integer")
+    if _worth_reducing(n, m):
+        n %= pisano_period(m)
+    return _fib_pair_mod(n, m)[0]
+
+def fib_mod_many(pairs) -> list[int]:
+    """
+    Batch form of fib_mod for an iterable of (n, m) pairs.
+    Pairs are grouped by modulus so each Pisano period is looked up once;
+    results come back in input order.
+    """
+    pairs = list(pairs)
+    groups: dict[int, list[int]] = {}
+    for i, (_, m) in enumerate(pairs):
+        groups.setdefault(m, []).append(i)
+    result = [0] * len(pairs)
+    for m, indices in groups.items():
+        if m < 1:
+            raise ValueError("m must be a positive integer")
+        period = None
+        for i in indices:
+            n = pairs[i][0]
+            if n < 0:
+                raise ValueError("n must be a non-negative integer")
+            if _worth_reducing(n, m):
+                period = period or pisano_period(m)
+                n %= period
+            result[i] = _fib_pair_mod(n, m)[0]
+    return result
+
+def fib_sequence(count: int, start: int = 0):
+    """
+    Yield count consecutive Fibonacci numbers F(start), F(start+1), ...
+    The starting pair comes from fast doubling; after that each term is one
+    addition, so streaming a million terms never recomputes anything.
+
+    Raises:
+        ValueError: if count or start is negative.
+    """
+    if count < 0 or start < 0:
+        raise ValueError("count and start must be non-negative integers")
+    a, b = _fib_pair(start)
+    for _ in range(count):
+        yield a
+        a, b = b, a + b
+
+# Orders up to this use matrix exponentiation; higher orders use Kitamasa.
+# benchmark_recurrences shows Kitamasa ahead from order 2 up, with or without a modulus.
+MATRIX_MAX_ORDER = 1
+
+class LinearRecurrence:
+    """
+    Constant-coefficient linear recurrence
+        a(n) = coeffs[0]*a(n-1) + coeffs[1]*a(n-2) + ... + coeffs[k-1]*a(n-k)
+    with a(0..k-1) = initial, optionally evaluated modulo m.
+
+    Terms at huge indices come from Kitamasa's method (O(k^2 log n)) or,
+    for orders up to MATRIX_MAX_ORDER, from repeated squaring of the k x k
+    companion matrix (O(k^3 log n)).
+    """
+
+    def __init__(self, coeffs, initial, mod: int | None = None) -> None:
+        self.coeffs = [int(c) for c in coeffs]
+        self.initial = [int(v) for v in initial]
+        if not self.coeffs:
+            raise ValueError("coeffs must not be empty")
+        if len(self.initial) != len(self.coeffs):
+            raise ValueError("initial must have one value per coefficient")
+        if mod is not None and mod < 1:
+            raise ValueError("mod must be a positive integer")
+        self.mod = mod
+        if mod is not None:
+            self.coeffs = [c % mod for c in self.coeffs]
+            self.initial = [v % mod for v in self.initial]
+
+    @property
+    def order(self) -> int:
+        return len(self.coeffs)
+
+    def _reduce(self, value: int) -> int:
+        return value % self.mod if self.mod is not None else value
+
+    def term(self, n: int, method: str | None = None) -> int:
+        """
+        Return a(n). method may be "kitamasa" or "matrix"; by default the
+        cheaper one for this order is chosen.
+
+        Raises:
+            ValueError: if n is negative or method is unknown.
+        """
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+        if n < self.order:
+            return self.initial[n]
+        if method is None:
+            method = "matrix" if self.order <= MATRIX_MAX_ORDER else "kitamasa"
+        if method == "kitamasa":
+            return self._kitamasa(n)
+        if method == "matrix":
+            return self._matrix(n)
+        raise ValueError("method must be 'kitamasa' or 'matrix'")
+
+    def _mul_mod_poly(self, p: list[int], q: list[int]) -> list[int]:
+        """Multiply two polynomials of degree < k and reduce modulo the characteristic polynomial."""
+        k = self.order
+        coeffs = self.coeffs
+        prod = [0] * (2 * k - 1)
+        for i, pi in enumerate(p):
+            if pi:
+                for j, qj in enumerate(q):
+                    prod[i + j] += pi * qj
+        # x^k = coeffs[0]*x^(k-1) + ... + coeffs[k-1]*x^0
+        for d in range(2 * k - 2, k - 1, -1):
+            top = self._reduce(prod[d])
+            if top:
+                for i, c in enumerate(coeffs):
+                    prod[d - 1 - i] += top * c
+        return [self._reduce(v) for v in prod[:k]]
+
+    def _shift_mod_poly(self, p: list[int]) -> list[int]:
+        """Multiply a polynomial of degree < k by x and reduce."""
+        top = p[-1]
+        shifted = [0] + p[:-1]
+        return [self._reduce(s + top * c) for s, c in zip(shifted, reversed(self.coeffs))]
+
+    def _kitamasa(self, n: int) -> int:
+        """a(n) from the coefficients of x^n modulo the characteristic polynomial."""
+        poly = [1] + [0] * (self.order - 1)  # x^0
+        for bit in bin(n)[2:]:
+            poly = self._mul_mod_poly(poly, poly)
+            if bit == "1":
+                poly = self._shift_mod_poly(poly)
+        return self._reduce(sum(p * v for p, v in zip(poly, self.initial)))
+
+    def _mat_mul(self, a: list[list[int]], b: list[list[int]]) -> list[list[int]]:
+        columns = list(zip(*b))
+        return [[self._reduce(sum(x * y for x, y in zip(row, col))) for col in columns] for row in a]
+
+    def _matrix(self, n: int) -> int:
+        """a(n) by repeated squaring of the companion matrix."""
+        k = self.order
+        companion = [self.coeffs[:]] + [[int(j == i) for j in range(k)] for i in range(k - 1)]
+        result = None
+        power = companion
+        while n:
+            if n & 1:
+                result = power if result is None else self._mat_mul(result, power)
+            n >>= 1
+            if n:
+                power = self._mat_mul(power, power)
+        # state (a(k-1), ..., a(0)) advanced n steps; a(n) is its last entry
+        state = self.initial[::-1]
+        return self._reduce(sum(x * y for x, y in zip(result[-1], state)))
+
+    def blocks(self, count: int, start: int = 0, block_size: int = 4096):
+        """
+        Yield the terms a(start) .. a(start+count-1) as lists of up to
+        block_size values. Only the first k terms are evaluated with term();
+        every later term is one dot product with the previous k.
+
+        Raises:
+            ValueError: if count or start is negative or block_size is not positive.
+        """
+        if count < 0 or start < 0:
+            raise ValueError("count and start must be non-negative integers")
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        k = self.order
+        window = [self.term(start + i) for i in range(k)]
+        weights = self.coeffs[::-1]  # weights[i] multiplies the i-th oldest of the last k terms
+        produced = 0
+        while produced < count:
+            size = min(block_size, count - produced)
+            block = window
+            while len(block) < size + k:
+                block.append(self._reduce(sum(w * v for w, v in zip(weights, block[-k:]))))
+            # the k terms after this block seed the next one
+            window = block[size:size + k]
+            produced += size
+            yield block[:size]
+
+    def terms(self, count: int, start: int = 0):
+        """Yield a(start) .. a(start+count-1) one at a time."""
+        for block in self.blocks(count, start):
+            yield from block
+
+# The Fibonacci sequence as a recurrence: F(n) = F(n-1) + F(n-2), F(0) = 0, F(1) = 1
+FIBONACCI = LinearRecurrence([1, 1], [0, 1])
+
+def benchmark_recurrences(orders=(2, 3, 5, 10, 20, 30, 50), n: int = 10**18, mod: int = 10**9 + 7) -> None:
+    """Time Kitamasa against matrix exponentiation for random recurrences of each order."""
+    print("=" * 60)
+    print(f"LINEAR RECURRENCE BENCHMARK (n = {n}, mod = {mod})")
+    print("=" * 60)
+    print(f"{'order':>6} {'kitamasa (s)':>14} {'matrix (s)':>12} {'chosen':>10}")
+    for k in orders:
+        rec = LinearRecurrence([random.randrange(mod) for _ in range(k)],
+                               [random.randrange(mod) for _ in range(k)], mod)
+        start = time.perf_counter()
+        fast = rec.term(n, method="kitamasa")
+        t_kitamasa = time.perf_counter() - start
+        start = time.perf_counter()
+        slow = rec.term(n, method="matrix")
+        t_matrix = time.perf_counter() - start
+        if fast != slow:
+            raise AssertionError(f"methods disagree for order {k}")
+        chosen = "matrix" if k <= MATRIX_MAX_ORDER else "kitamasa"
+        print(f"{k:>6} {t_kitamasa:>14.4f} {t_matrix:>12.4f} {chosen:>10}")
+
+def benchmark_fib_mod(n: int = 10**100, repeat: int = 100) -> None:
+    """Time fib_mod against plain doubling mod m, including 64-bit moduli with large prime factors."""
+    moduli = [10**9 + 7, 2**32, 10**18 + 9, (10**9 + 7) * (10**9 + 9), 2**61 - 1]
+    print("=" * 60)
+    print(f"FIB_MOD BENCHMARK ({n.bit_length()}-bit n)")
+    print("=" * 60)
+    print(f"{'m':>22} {'first call (ms)':>16} {'cached (ms)':>12} {'doubling (ms)':>14}")
+    for m in moduli:
+        pisano_period.cache_clear()
+        start = time.perf_counter()
+        value = fib_mod(n, m)
+        t_first = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fib_mod(n, m)
+        t_cached = (time.perf_counter() - start) / repeat
+        start = time.perf_counter()
+        for _ in range(repeat):
+            plain = _fib_pair_mod(n, m)[0]
+        t_plain = (time.perf_counter() - start) / repeat
+        if value != plain:
+            raise AssertionError(f"fib_mod disagrees with plain doubling for m = {m}")
+        print(f"{m:>22} {1e3 * t_first:>16.3f} {1e3 * t_cached:>12.4f} {1e3 * t_plain:>14.4f}")
+
 if __name__ == "__main__":
     try:
         s = input("Enter a non-negative integer n to compute F(n) (F(0)=0, F(1)=1): ").strip()
@@ -35,22 +497,27 @@ if __name__ == "__main__":
         if n < 0:
             print("Please enter a non-negative integer.")
         else:
-            # Warn about exponential runtime for large n when using plain recursion
-            if n > 35:
-                print("Warning: recursive Fibonacci is exponential time. Results may be slow for large n.")
-            show = "n"
-            if n <= 12:  # offer trace only for reasonably small n
-                show = input("Show recursion trace? (y/n) [small n recommended]: ").strip().lower()
-            trace = [] if show == "y" else None
-
-            value = fib_recursive(n, trace)
+            show = input("Show recursion trace? (y/n) [small n recommended]: ").strip().lower()
+            trace = None
+            if show == "y":
+                if n > 35:
+                    print("Warning: recursive Fibonacci is exponential time. Results may be slow for large n.")
+                # Full trace for small n; for larger n keep only the most recent events
+                trace = [] if n <= 12 else RingBufferSink(capacity=20)
+
+            # The exponential recursive version only runs when a trace is requested
+            value = fib_recursive(n, trace) if trace is not None else fib_fast(n)
             print(f"F({n}) = {value}")
 
             # If trace was collected, print a brief step-by-step explanation
-            if trace is not None:
+            if isinstance(trace, list):
                 print("\nRecursion trace (calls and returns):")
                 for line in trace:
                     print(line)
+            elif trace is not None:
+                print(f"\nLast {len(trace.events)} of {trace.seen} recursion trace events:")
+                for event in trace.events:
+                    print(format_trace_event(*event))
 
             # Short explanation of the algorithm
             print("\nExplanation:")
@@ -1,3 +1,7 @@
+
+import repo_root  # puts the repository root on sys.path
+from trampoline import run
+
 def sum_to_n_iterative(n: int) -> int:
     """
     Calculate sum of first n natural numbers using iteration.
@@ -24,9 +28,13 @@ def sum_to_n_recursive(n: int) -> int:
     Calculate sum of first n natural numbers using recursion.
     Returns 0 for n <= 0.
     """
+    return run(_sum_to_n_steps(n))
+
+def _sum_to_n_steps(n: int):
+    """Generator form of sum_to_n_recursive, driven by trampoline.run."""
     if n <= 0:
         return 0
-    return n + sum_to_n_recursive(n - 1)
+    return n + (yield _sum_to_n_steps(n - 1))
 
 if __name__ == "__main__":
     try:
@@ -43,12 +51,12 @@ if __name__ == "__main__":
             print(f"Using iteration: {iter_sum}")
             print(f"Using formula:   {form_sum}")
             
-            # Only use recursion for smaller numbers to avoid stack overflow
-            if n <= 1000:
+            # Recursion runs on an explicit stack, so depth is limited only by memory
+            if n <= 1_000_000:
                 rec_sum = sum_to_n_recursive(n)
                 print(f"Using recursion: {rec_sum}")
             else:
-                print("Recursion skipped for large n to avoid stack overflow")
+                print("Recursion skipped for very large n to save time and memory")
                 
     except ValueError:
         print("Invalid input. Please enter a valid integer.")
@@ -0,0 +1,156 @@
+import importlib.util
+import os
+import random
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from task3 import _SENTENCE_CHARS, is_sentence_palindrome
+
+# Inputs are split into chunks of this many strings before going to the pool.
+DEFAULT_CHUNK_SIZE = 20_000
+
+# Batches with fewer strings than this are classified in-process.
+MIN_PARALLEL_BATCH = 100_000
+
+_ASCII_ALNUM = frozenset(_SENTENCE_CHARS)
+
+def _sentence_rule(ch: str):
+    """is_sentence_palindrome rule: keep ASCII letters and digits, lowercased."""
+    return ch.lower() if ch in _ASCII_ALNUM else None
+
+def _alnum_rule(ch: str):
+    """is_palindrome rule: keep any Unicode alphanumeric, lowercased."""
+    return ch.lower() if ch.isalnum() else None
+
+class _TranslateTable(dict):
+    """str.translate table that works out each code point once, on first sight.
+
+    Characters the rule rejects map to None, so translate deletes them.
+    """
+
+    def __init__(self, rule) -> None:
+        super().__init__()
+        self.rule = rule
+
+    def __missing__(self, code: int):
+        value = self.rule(chr(code))
+        self[code] = value
+        return value
+
+# One shared table per normalization mode
+_TABLES = {
+    "sentence": _TranslateTable(_sentence_rule),
+    "alnum": _TranslateTable(_alnum_rule),
+}
+
+def _classify_chunk(args) -> list[bool]:
+    """Classify one chunk of strings; runs inside pool workers."""
+    strings, mode = args
+    table = _TABLES[mode]
+    result = []
+    for s in strings:
+        if not isinstance(s, str):
+            raise TypeError(f"Input must be a string, not {type(s).__name__}")
+        cleaned = s.translate(table)
+        result.append(cleaned == cleaned[::-1])
+    return result
+
+def classify_palindromes(strings, mode: str = "sentence", workers: int | None = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[bool]:
+    """
+    Check many strings for palindromes in one call.
+
+    Every string is normalized with a single str.translate call against a
+    shared table instead of a regex or a per-character generator.
+
+    Args:
+        strings: Iterable of strings to classify
+        mode: "sentence" keeps ASCII letters and digits (is_sentence_palindrome);
+              "alnum" keeps any Unicode alphanumeric (is_palindrome)
+        workers: Process pool size; defaults to the CPU count. Batches smaller
+                 than MIN_PARALLEL_BATCH, or workers=1, run in-process.
+        chunk_size: Number of strings sent to a worker at a time
+
+    Returns:
+        A list of booleans, one per input string, in input order
+
+    Raises:
+        ValueError: If mode or chunk_size is invalid
+        TypeError: If any item is not a string
+    """
+    if mode not in _TABLES:
+        raise ValueError(f"mode must be one of {sorted(_TABLES)}, not {mode!r}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    items = list(strings)
+    if len(items) < MIN_PARALLEL_BATCH or workers == 1:
+        return _classify_chunk((items, mode))
+    chunks = [(items[i:i + chunk_size], mode) for i in range(0, len(items), chunk_size)]
+    result: list[bool] = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for part in pool.map(_classify_chunk, chunks):
+            result.extend(part)
+    return result
+
+def _load_is_palindrome():
+    """Load is_palindrome from assignment 2 for comparison, or None if it is missing."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assignment 2", "task2.py")
+    try:
+        spec = importlib.util.spec_from_file_location("assignment2_task2", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.is_palindrome
+    except Exception:
+        return None
+
+def benchmark_throughput(count: int = 200_000) -> None:
+    """Compare strings/second of classify_palindromes against the per-call functions."""
+    words = ["A man, a plan, a canal: Panama", "race car", "Hello World", "No 'x' in Nixon"]
+    samples = [random.choice(words) + " " + "".join(random.choices(string.ascii_letters, k=8))
+               for _ in range(count)]
+    samples += [s + s[::-1] for s in samples[: count // 2]]
+    print("=" * 70)
+    print(f"PALINDROME THROUGHPUT ({len(samples)} strings)")
+    print("=" * 70)
+
+    def report(label, func):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<40} {len(samples) / elapsed:>14,.0f} strings/s")
+        return result
+
+    expected = report("is_sentence_palindrome (per call)",
+                      lambda: [is_sentence_palindrome(s) for s in samples])
+    batch = report("classify_palindromes (sentence, serial)",
+                   lambda: classify_palindromes(samples, workers=1))
+    pooled = report("classify_palindromes (sentence, pool)",
+                    lambda: classify_palindromes(samples))
+    if not expected == batch == pooled:
+        raise AssertionError("batch results differ from is_sentence_palindrome")
+    is_palindrome = _load_is_palindrome()
+    if is_palindrome is not None:
+        expected = report("is_palindrome (per call)", lambda: [is_palindrome(s) for s in samples])
+        batch = report("classify_palindromes (alnum, serial)",
+                       lambda: classify_palindromes(samples, mode="alnum", workers=1))
+        if expected != batch:
+            raise AssertionError("batch results differ from is_palindrome")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Classify lines of a file\n2. Run throughput benchmark\nEnter choice (1-2): ").strip()
+        if choice == "1":
+            path = input("Enter the path of the file: ").strip()
+            with open(path, encoding="utf-8") as f:
+                lines = [line.rstrip("\n") for line in f]
+            flags = classify_palindromes(lines)
+            print(f"{sum(flags)} of {len(flags)} lines are palindromes.")
+        elif choice == "2":
+            benchmark_throughput()
+        else:
+            print("Invalid choice!")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
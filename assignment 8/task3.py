@@ -1,4 +1,17 @@
+import mmap
+import os
 import re
+import string
+from array import array
+
+# Characters the sentence rules keep (ASCII letters and digits); the regexes
+# and byte tables below are all built from this one definition.
+_SENTENCE_CHARS = string.ascii_letters + string.digits
+_DROP_PATTERN = re.compile(f"[^{_SENTENCE_CHARS}]")
+_KEEP_PATTERN = re.compile(f"[{_SENTENCE_CHARS}]+")
+_ALNUM_BYTES = _SENTENCE_CHARS.encode("ascii")
+_NON_ALNUM_BYTES = bytes(b for b in range(256) if b not in _ALNUM_BYTES)
+_LOWER_TABLE = bytes.maketrans(string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii"))
 
 def is_sentence_palindrome(sentence: str) -> bool:
     """
@@ -21,7 +34,7 @@ def is_sentence_palindrome(sentence: str) -> bool:
         raise TypeError(f"Input must be a string, not {type(sentence).__name__}")
     
     # Remove non-alphanumeric characters and convert to lowercase
-    cleaned = re.sub(r'[^a-zA-Z0-9]', '', sentence).lower()
+    cleaned = _DROP_PATTERN.sub('', sentence).lower()
     
     # Handle empty or single character strings
     if len(cleaned) <= 1:
@@ -30,6 +43,150 @@ def is_sentence_palindrome(sentence: str) -> bool:
     # Check if cleaned string equals its reverse
     return cleaned == cleaned[::-1]
 
+def _clean_bytes(chunk) -> bytes:
+    """Drop non-alphanumeric bytes from chunk and lowercase the rest."""
+    return bytes(chunk).translate(_LOWER_TABLE, _NON_ALNUM_BYTES)
+
+def _is_buffer_palindrome(data, chunk_size: int) -> bool:
+    """Two-pointer palindrome check over a bytes-like object, one chunk at a time."""
+    lo, hi = 0, len(data)
+    front = b""  # cleaned bytes read from the left, in reading order
+    back = b""   # cleaned bytes read from the right, nearest the end first
+    while True:
+        n = min(len(front), len(back))
+        if n:
+            if front[:n] != back[:n]:
+                return False
+            front, back = front[n:], back[n:]
+        if lo >= hi:
+            break
+        if not front:
+            end = min(lo + chunk_size, hi)
+            front = _clean_bytes(data[lo:end])
+            lo = end
+        else:
+            start = max(hi - chunk_size, lo)
+            back = _clean_bytes(data[start:hi])[::-1]
+            hi = start
+    # Whatever is left lies in the middle and is at most one chunk long
+    middle = front + back[::-1]
+    return middle == middle[::-1]
+
+def is_sentence_palindrome_file(source, chunk_size: int = 1 << 20) -> bool:
+    """
+    Streaming version of is_sentence_palindrome for inputs too large to copy.
+    
+    Walks inward from both ends, cleaning at most chunk_size bytes per side at
+    a time, so memory stays O(chunk_size) and the check stops at the first
+    mismatching chunk. Only ASCII letters and digits are compared, exactly as
+    in is_sentence_palindrome; all other bytes (including UTF-8 multibyte
+    sequences) are skipped.
+    
+    Args:
+        source: Path to a file (memory-mapped), or a bytes-like buffer
+        chunk_size: Number of raw bytes read from each end per step
+        
+    Returns:
+        True if the cleaned contents are a palindrome, False otherwise
+        
+    Raises:
+        TypeError: If source is neither a path nor a bytes-like object
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _is_buffer_palindrome(source, chunk_size)
+    if not isinstance(source, (str, os.PathLike)):
+        raise TypeError(f"Input must be a file path or bytes-like object, not {type(source).__name__}")
+    with open(source, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _is_buffer_palindrome(data, chunk_size)
+
+def _clean_with_offsets(sentence: str) -> tuple[str, array]:
+    """Apply the is_sentence_palindrome cleaning rules and remember where each kept character came from."""
+    runs = []
+    offsets = array("q")
+    for match in _KEEP_PATTERN.finditer(sentence):
+        runs.append(match.group())
+        offsets.extend(range(match.start(), match.end()))
+    return "".join(runs).lower(), offsets
+
+def palindrome_radii(sentence: str) -> tuple[array, array, array]:
+    """
+    Compute per-position palindrome radii with Manacher's algorithm in O(n).
+    
+    The sentence is cleaned exactly as in is_sentence_palindrome. For the
+    i-th kept character, odd[i] is the radius (including the centre) of the
+    longest odd-length palindrome centred on it, and even[i] is the radius of
+    the longest even-length palindrome centred just before it.
+    
+    Args:
+        sentence: String to analyse
+        
+    Returns:
+        (offsets, odd, even), where offsets[i] is the index in sentence of
+        the i-th kept character
+        
+    Raises:
+        TypeError: If input is not a string
+    """
+    if not isinstance(sentence, str):
+        raise TypeError(f"Input must be a string, not {type(sentence).__name__}")
+    s, offsets = _clean_with_offsets(sentence)
+    n = len(s)
+    odd = array("l", [0]) * n
+    even = array("l", [0]) * n
+    
+    # Odd-length palindromes; [left, right] is the rightmost palindrome found so far
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+    
+    # Even-length palindromes
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return offsets, odd, even
+
+def longest_palindromic_substring(sentence: str) -> tuple[int, int]:
+    """
+    Find the longest palindromic stretch of a sentence, ignoring case, spaces, and punctuation.
+    
+    Args:
+        sentence: String to search
+        
+    Returns:
+        (start, end) offsets into sentence such that sentence[start:end] is
+        the longest palindrome under is_sentence_palindrome's rules. The first
+        one wins on ties; (0, 0) if the sentence has no letters or digits.
+        
+    Raises:
+        TypeError: If input is not a string
+    """
+    offsets, odd, even = palindrome_radii(sentence)
+    best_length, best_start = 0, 0
+    for i in range(len(offsets)):
+        if 2 * odd[i] - 1 > best_length:
+            best_length, best_start = 2 * odd[i] - 1, i - odd[i] + 1
+        if 2 * even[i] > best_length:
+            best_length, best_start = 2 * even[i], i - even[i]
+    if best_length == 0:
+        return 0, 0
+    return offsets[best_start], offsets[best_start + best_length - 1] + 1
+
 def run_tests():
     """Run comprehensive test cases for is_sentence_palindrome function"""
     
@@ -158,6 +315,43 @@ def run_tests():
             failed += 1
         print()
     
+    # Streaming mode must agree with the in-memory check on every valid case
+    print("\nSTREAMING MODE TESTS (is_sentence_palindrome_file, 3-byte chunks):")
+    print("-" * 90)
+    
+    for sentence, expected, description in test_cases:
+        result = is_sentence_palindrome_file(sentence.encode("utf-8"), chunk_size=3)
+        if result == expected:
+            passed += 1
+        else:
+            failed += 1
+            print(f"✗ FAIL | Input: '{sentence}' | Expected: {expected}, Got: {result}")
+    print(f"Checked {len(test_cases)} cases in streaming mode.")
+    print()
+    
+    # Longest palindromic substring, as offsets into the original text
+    longest_cases = [
+        ("", ""),
+        ("!!!", ""),
+        ("abc", "a"),
+        ("xx racecar yy", "racecar"),
+        ("Say: Was it a car or a cat I saw? No.", "Was it a car or a cat I saw"),
+        ("GGACGTTGCATT", "ACGTTGCA"),
+    ]
+    print("\nLONGEST PALINDROMIC SUBSTRING TESTS:")
+    print("-" * 90)
+    
+    for sentence, expected in longest_cases:
+        start, end = longest_palindromic_substring(sentence)
+        result = sentence[start:end]
+        if result == expected:
+            passed += 1
+            print(f"✓ PASS | Input: '{sentence}' -> '{result}'")
+        else:
+            failed += 1
+            print(f"✗ FAIL | Input: '{sentence}' | Expected: '{expected}', Got: '{result}'")
+    print()
+    
     print("=" * 90)
     total = passed + failed
     print(f"TEST SUMMARY: {passed}/{total} passed, {failed}/{total} failed")
@@ -166,7 +360,7 @@ def run_tests():
 
 if __name__ == "__main__":
     try:
-        choice = input("1. Run all test cases\n2. Check single sentence\nEnter choice (1-2): ").strip()
+        choice = input("1. Run all test cases\n2. Check single sentence\n3. Check a file\n4. Find longest palindromic substring\nEnter choice (1-4): ").strip()
         
         if choice == "1":
             success = run_tests()
@@ -183,6 +377,18 @@ if __name__ == "__main__":
                 print(f"\n{status} a palindrome: '{sentence}'")
             except TypeError as e:
                 print(f"\n✗ Error: {e}")
+        elif choice == "3":
+            path = input("Enter the path of the file to check: ").strip()
+            try:
+                result = is_sentence_palindrome_file(path)
+                status = "✓ IS" if result else "✗ IS NOT"
+                print(f"\n{status} a palindrome: '{path}'")
+            except OSError as e:
+                print(f"\n✗ Error: {e}")
+        elif choice == "4":
+            sentence = input("Enter a sentence to search: ")
+            start, end = longest_palindromic_substring(sentence)
+            print(f"\nLongest palindrome: '{sentence[start:end]}' (characters {start} to {end})")
         else:
             print("Invalid choice!")
             
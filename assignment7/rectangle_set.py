@@ -0,0 +1,233 @@
+import heapq
+import math
+import operator
+import random
+import time
+import tracemalloc
+from array import array
+
+from task4 import Rectangle
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; areas and perimeters fall back to array('d')
+    np = None
+
+# Children per R-tree node.
+NODE_CAPACITY = 16
+
+class RectangleSet:
+    """Many axis-aligned rectangles kept in four contiguous float arrays.
+
+    Rectangle i has its lower-left corner at (x[i], y[i]) and extends
+    length[i] along x and width[i] along y, so a million rectangles take
+    32 MB instead of a million Python objects. Overlap, point and nearest
+    queries go through a packed R-tree (Sort-Tile-Recursive bulk load) that
+    is built on the first query and rebuilt after the set changes.
+    """
+
+    def __init__(self) -> None:
+        self.x = array('d')
+        self.y = array('d')
+        self.length = array('d')
+        self.width = array('d')
+        self._levels = None   # R-tree node bounds, leaves first; None when stale
+        self._order = None    # rectangle index of each leaf entry
+
+    @classmethod
+    def from_rectangles(cls, rectangles, xs=None, ys=None) -> "RectangleSet":
+        """Build a set from Rectangle objects, placed at (xs[i], ys[i]) or at the origin."""
+        result = cls()
+        rectangles = list(rectangles)
+        xs = [0.0] * len(rectangles) if xs is None else xs
+        ys = [0.0] * len(rectangles) if ys is None else ys
+        for rect, x, y in zip(rectangles, xs, ys, strict=True):
+            result.add(x, y, rect.length, rect.width)
+        return result
+
+    def add(self, x: float, y: float, length: float, width: float) -> int:
+        """Append a rectangle and return its index."""
+        if length < 0 or width < 0:
+            raise ValueError("length and width must not be negative")
+        self.x.append(x)
+        self.y.append(y)
+        self.length.append(length)
+        self.width.append(width)
+        self._levels = self._order = None
+        return len(self.x) - 1
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def rectangle(self, i: int) -> Rectangle:
+        """Return rectangle i as a Rectangle object (its position is not part of Rectangle)."""
+        return Rectangle(self.length[i], self.width[i])
+
+    def bounds(self, i: int) -> tuple[float, float, float, float]:
+        """Return (min_x, min_y, max_x, max_y) of rectangle i."""
+        return self.x[i], self.y[i], self.x[i] + self.length[i], self.y[i] + self.width[i]
+
+    def areas(self):
+        """Return every rectangle's area (a NumPy array, or array('d') without NumPy)."""
+        if np is not None:
+            return np.frombuffer(self.length) * np.frombuffer(self.width)
+        return array('d', map(operator.mul, self.length, self.width))
+
+    def perimeters(self):
+        """Return every rectangle's perimeter (a NumPy array, or array('d') without NumPy)."""
+        if np is not None:
+            return 2 * (np.frombuffer(self.length) + np.frombuffer(self.width))
+        return array('d', (2 * (a + b) for a, b in zip(self.length, self.width)))
+
+    def _build_index(self) -> None:
+        """Bulk-load the R-tree: sort leaves into tiles, then group NODE_CAPACITY at a time upwards."""
+        n, m = len(self), NODE_CAPACITY
+        x, y, length, width = self.x, self.y, self.length, self.width
+        order = sorted(range(n), key=lambda i: x[i] + length[i] / 2)
+        slab = m * math.ceil(math.sqrt(math.ceil(n / m))) if n else 1
+        for start in range(0, n, slab):
+            order[start:start + slab] = sorted(order[start:start + slab], key=lambda i: y[i] + width[i] / 2)
+        level = (array('d', (x[i] for i in order)), array('d', (y[i] for i in order)),
+                 array('d', (x[i] + length[i] for i in order)), array('d', (y[i] + width[i] for i in order)))
+        levels = [level]
+        while len(level[0]) > 1:
+            min_x, min_y, max_x, max_y = level
+            starts = range(0, len(min_x), m)
+            level = (array('d', (min(min_x[s:s + m]) for s in starts)),
+                     array('d', (min(min_y[s:s + m]) for s in starts)),
+                     array('d', (max(max_x[s:s + m]) for s in starts)),
+                     array('d', (max(max_y[s:s + m]) for s in starts)))
+            levels.append(level)
+        self._levels, self._order = levels, array('q', order)
+
+    def _search(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Indices of rectangles whose closed bounds meet the box [x0, x1] x [y0, y1]."""
+        if not len(self):
+            return []
+        if self._levels is None:
+            self._build_index()
+        levels, m = self._levels, NODE_CAPACITY
+        found = []
+        stack = [(len(levels) - 1, 0)]
+        while stack:
+            depth, node = stack.pop()
+            min_x, min_y, max_x, max_y = levels[depth]
+            if min_x[node] > x1 or max_x[node] < x0 or min_y[node] > y1 or max_y[node] < y0:
+                continue
+            if depth == 0:
+                found.append(self._order[node])
+            else:
+                below = len(levels[depth - 1][0])
+                stack.extend((depth - 1, child) for child in range(node * m, min(node * m + m, below)))
+        return sorted(found)
+
+    def overlapping(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Return the indices of rectangles that overlap the box from (x0, y0) to (x1, y1).
+
+        Rectangles that only touch the box along an edge count as overlapping.
+        """
+        return self._search(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+
+    def containing(self, px: float, py: float) -> list[int]:
+        """Return the indices of rectangles that contain the point (px, py), edges included."""
+        return self._search(px, py, px, py)
+
+    def nearest(self, px: float, py: float, k: int = 1) -> list[tuple[float, int]]:
+        """Return up to k (distance, index) pairs for the rectangles closest to (px, py).
+
+        The distance is 0 for rectangles that contain the point. The tree is
+        searched best-first, so only nodes nearer than the k-th answer are opened.
+        """
+        if not len(self) or k <= 0:
+            return []
+        if self._levels is None:
+            self._build_index()
+        levels, m = self._levels, NODE_CAPACITY
+
+        def distance(depth: int, node: int) -> float:
+            min_x, min_y, max_x, max_y = levels[depth]
+            dx = max(min_x[node] - px, 0.0, px - max_x[node])
+            dy = max(min_y[node] - py, 0.0, py - max_y[node])
+            return math.hypot(dx, dy)
+
+        top = len(levels) - 1
+        heap = [(distance(top, 0), top, 0)]
+        result = []
+        while heap and len(result) < k:
+            dist, depth, node = heapq.heappop(heap)
+            if depth == 0:
+                result.append((dist, self._order[node]))
+                continue
+            below = len(levels[depth - 1][0])
+            for child in range(node * m, min(node * m + m, below)):
+                heapq.heappush(heap, (distance(depth - 1, child), depth - 1, child))
+        return result
+
+def _random_layout(count: int, extent: float = 10_000.0):
+    """Random positions and sizes for the benchmark."""
+    return [(random.uniform(0, extent), random.uniform(0, extent),
+             random.uniform(1, 20), random.uniform(1, 20)) for _ in range(count)]
+
+def benchmark_rectangle_set(count: int = 200_000, queries: int = 200) -> None:
+    """Compare memory and query time of RectangleSet against a list of Rectangle objects."""
+    layout = _random_layout(count)
+    print("=" * 60)
+    print(f"RECTANGLE SET BENCHMARK ({count} rectangles)")
+    print("=" * 60)
+    tracemalloc.start()
+    objects = [(x, y, Rectangle(length, width)) for x, y, length, width in layout]
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    rects = RectangleSet()
+    for x, y, length, width in layout:
+        rects.add(x, y, length, width)
+    start = time.perf_counter()
+    rects._build_index()
+    build_time = time.perf_counter() - start
+    set_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"list of Rectangle:   {object_bytes / count:8.1f} bytes per rectangle")
+    print(f"RectangleSet:        {set_bytes / count:8.1f} bytes per rectangle (with index)")
+    print(f"Index build:         {build_time:8.3f} s")
+
+    boxes = [(x, y, x + 50, y + 50) for x, y, _, _ in _random_layout(queries)]
+    start = time.perf_counter()
+    expected = [sorted(i for i, (x, y, r) in enumerate(objects)
+                       if x <= x1 and x + r.length >= x0 and y <= y1 and y + r.width >= y0)
+                for x0, y0, x1, y1 in boxes]
+    t_scan = (time.perf_counter() - start) / queries
+    start = time.perf_counter()
+    found = [rects.overlapping(*box) for box in boxes]
+    t_index = (time.perf_counter() - start) / queries
+    if found != expected:
+        raise AssertionError("indexed overlap query differs from a linear scan")
+    print(f"Overlap, list scan:  {1e3 * t_scan:8.3f} ms/query")
+    print(f"Overlap, R-tree:     {1e3 * t_index:8.3f} ms/query")
+    start = time.perf_counter()
+    for x0, y0, _, _ in boxes:
+        rects.nearest(x0, y0)
+    print(f"Nearest, R-tree:     {1e3 * (time.perf_counter() - start) / queries:8.3f} ms/query")
+
+if __name__ == "__main__":
+    try:
+        choice = input("1. Query random rectangles\n2. Run benchmark\nEnter choice (1-2): ").strip()
+        if choice == "1":
+            count = int(input("Enter number of rectangles: "))
+            rects = RectangleSet()
+            for x, y, length, width in _random_layout(count):
+                rects.add(x, y, length, width)
+            px = float(input("Enter point x (0-10000): "))
+            py = float(input("Enter point y (0-10000): "))
+            print(f"Rectangles containing the point: {rects.containing(px, py)}")
+            dist, index = rects.nearest(px, py)[0]
+            print(f"Nearest rectangle: #{index} {rects.bounds(index)} at distance {dist:.2f}")
+            print(f"Total area: {sum(rects.areas()):.2f}")
+        elif choice == "2":
+            benchmark_rectangle_set()
+        else:
+            print("Invalid choice!")
+    except (ValueError, IndexError):
+        print("Please enter valid numbers.")
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
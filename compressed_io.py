@@ -0,0 +1,208 @@
+# Open plain, gzip, bzip2 or xz files through one call, chosen by the file's
+# magic bytes rather than its extension:
+#
+#     with open_binary("readings.csv.gz") as f:
+#         for block in iter(lambda: f.read(1 << 20), b""):
+#             ...
+#
+# Everything is decompressed as a stream, so memory stays bounded by the read
+# size. gzip files made of BGZF blocks (bgzip, or any writer that records each
+# member's size in a 'BC' extra field) are decompressed by a thread pool,
+# several blocks at a time; zlib releases the GIL while it inflates.
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+MAGIC_NUMBERS = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+# Fixed part of a gzip member header: magic, method, flags, mtime, xfl, os, xlen.
+_GZIP_HEADER = struct.Struct("<2sBBIBBH")
+_FEXTRA = 4
+
+# Uncompressed size of each block written by write_bgzf (BGZF uses 64 KiB).
+BGZF_BLOCK_SIZE = 0xff00
+
+def sniff_format(path: str) -> str | None:
+    """Return 'gzip', 'bz2' or 'xz' for a compressed file, or None for anything else."""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for name, magic in MAGIC_NUMBERS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+def _bgzf_member_size(header: bytes) -> int | None:
+    """Return the total size of the gzip member starting with header, if its 'BC' field records it."""
+    if len(header) < _GZIP_HEADER.size:
+        return None
+    magic, method, flags, _, _, _, xlen = _GZIP_HEADER.unpack_from(header)
+    if magic != MAGIC_NUMBERS["gzip"] or method != 8 or not flags & _FEXTRA:
+        return None
+    extra = header[_GZIP_HEADER.size:_GZIP_HEADER.size + xlen]
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, length = extra[pos:pos + 2], int.from_bytes(extra[pos + 2:pos + 4], "little")
+        if tag == b"BC" and length == 2:
+            return int.from_bytes(extra[pos + 4:pos + 6], "little") + 1
+        pos += 4 + length
+    return None
+
+class ParallelGzipReader(io.RawIOBase):
+    """Read-only stream over a BGZF gzip file, inflating blocks on a thread pool.
+
+    At most 4 * workers blocks are in flight at once, so memory stays
+    bounded. If a member without a size field turns up, the rest of the file
+    is read serially with the gzip module.
+    """
+
+    def __init__(self, path: str, workers: int | None = None) -> None:
+        self._raw = open(path, "rb")
+        self._workers = workers or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self._workers)
+        self._pending = deque()
+        self._buffer = memoryview(b"")
+        self._serial = None
+        self._exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_block(self) -> bytes | None:
+        """Read the next whole member from the raw file, or None at the end or at a non-BGZF member."""
+        start = self._raw.tell()
+        header = self._raw.read(64)
+        size = _bgzf_member_size(header)
+        self._raw.seek(start)
+        if size is None:
+            return None
+        block = self._raw.read(size)
+        if len(block) < size:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        return block
+
+    def _fill(self) -> None:
+        """Keep the pool busy with up to 4 * workers blocks."""
+        while not self._exhausted and len(self._pending) < 4 * self._workers:
+            block = self._next_block()
+            if block is None:
+                self._exhausted = True
+                if self._raw.read(1):
+                    self._raw.seek(-1, io.SEEK_CUR)
+                    self._serial = gzip.GzipFile(fileobj=self._raw)
+                break
+            self._pending.append(self._pool.submit(zlib.decompress, block, 31))
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._fill()
+            if self._pending:
+                self._buffer = memoryview(self._pending.popleft().result())
+            elif self._serial is not None:
+                return self._serial.readinto(buffer)
+            else:
+                return 0
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._pending:
+                future.cancel()
+            self._pool.shutdown(wait=True)
+            if self._serial is not None:
+                self._serial.close()
+            self._raw.close()
+        super().close()
+
+def open_binary(path: str, workers: int | None = None):
+    """Open path for binary reading, decompressing gzip, bz2 or xz on the fly.
+
+    BGZF gzip is inflated in parallel by up to workers threads (default:
+    one per CPU); ordinary gzip, bz2 and xz, and BGZF when only one worker
+    is available, are streamed on one thread. Plain files are opened as
+    they are, so they keep seek() and fileno().
+    """
+    kind = sniff_format(path)
+    if kind == "gzip":
+        workers = workers or os.cpu_count() or 1
+        parallel = False
+        if workers > 1:
+            with open(path, "rb") as f:
+                parallel = _bgzf_member_size(f.read(64)) is not None
+        if parallel:
+            return io.BufferedReader(ParallelGzipReader(path, workers), buffer_size=1 << 20)
+        return gzip.open(path, "rb")
+    if kind == "bz2":
+        return bz2.open(path, "rb")
+    if kind == "xz":
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+def open_text(path: str, encoding: str = "utf-8", errors: str = "strict", workers: int | None = None):
+    """Text-mode counterpart of open_binary, with universal newlines like open()."""
+    return io.TextIOWrapper(open_binary(path, workers), encoding=encoding, errors=errors)
+
+def write_bgzf(path: str, data: bytes, level: int = 6) -> None:
+    """Write data as BGZF: independent gzip members of at most BGZF_BLOCK_SIZE bytes each.
+
+    The output is an ordinary gzip file that any gzip reader accepts, and
+    open_binary can inflate its blocks in parallel.
+    """
+    with open(path, "wb") as f:
+        for pos in range(0, len(data), BGZF_BLOCK_SIZE):
+            chunk = data[pos:pos + BGZF_BLOCK_SIZE]
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            body = compressor.compress(chunk) + compressor.flush()
+            size = _GZIP_HEADER.size + 6 + len(body) + 8
+            f.write(_GZIP_HEADER.pack(MAGIC_NUMBERS["gzip"], 8, _FEXTRA, 0, 0, 255, 6))
+            f.write(b"BC" + struct.pack("<HH", 2, size - 1))
+            f.write(body)
+            f.write(struct.pack("<II", zlib.crc32(chunk), len(chunk)))
+
+def benchmark(size: int = 64 * 1024 * 1024) -> None:
+    """Compare read throughput of plain, gzip, BGZF (serial and parallel), bz2 and xz copies of one file."""
+    line = b"".join(b"%d,%d.%d\n" % (i, i * 7 % 1000, i % 97) for i in range(1000))
+    data = (line * (size // len(line) + 1))[:size]
+    print("=" * 60)
+    print(f"COMPRESSED INPUT BENCHMARK ({size // (1024 * 1024)} MiB of CSV text)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: os.path.join(tmp, name) for name in ("plain", "gzip", "bgzf", "bz2", "xz")}
+        with open(paths["plain"], "wb") as f:
+            f.write(data)
+        with gzip.open(paths["gzip"], "wb") as f:
+            f.write(data)
+        write_bgzf(paths["bgzf"], data)
+        with bz2.open(paths["bz2"], "wb") as f:
+            f.write(data[:size // 8])
+        with lzma.open(paths["xz"], "wb") as f:
+            f.write(data[:size // 8])
+        cases = [("plain", paths["plain"], None), ("gzip", paths["gzip"], None),
+                 ("bgzf, 1 thread", paths["bgzf"], 1), ("bgzf, all cores", paths["bgzf"], None),
+                 ("bz2", paths["bz2"], None), ("xz", paths["xz"], None)]
+        for label, path, workers in cases:
+            start = time.perf_counter()
+            total = 0
+            with open_binary(path, workers) as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    total += len(block)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<18} {total / elapsed / 1e6:10.1f} MB/s")
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,98 @@
+# Integer factorization shared by the assignments:
+#
+#     prime_factors(360)    # {2: 3, 3: 2, 5: 1}
+#
+# Primes below 1000 are divided out first; whatever remains is split with
+# Brent's variant of Pollard's rho, and a Miller-Rabin test decides when a
+# piece is prime. Nothing here imports assignment code, so any folder can use
+# it the same way it uses trampoline.py.
+
+import math
+import random
+
+# Primes used for trial division; the cofactor left after them has no factor below 1000.
+SMALL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, math.isqrt(p) + 1))]
+
+# Miller-Rabin with these bases is exact for every n below DETERMINISTIC_LIMIT.
+_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+
+def is_prime(n: int, rounds: int = 20) -> bool:
+    """Miller-Rabin test: exact below DETERMINISTIC_LIMIT, probable (rounds random bases) above it."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:12]:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = list(_BASES)
+    if n >= DETERMINISTIC_LIMIT:
+        bases += [random.randrange(2, n - 1) for _ in range(rounds)]
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_brent(n: int) -> int:
+    """Return a non-trivial factor of the odd composite n (Brent's variant of rho)."""
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # the batched gcd overshot; retrace one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+def prime_factors(n: int) -> dict[int, int]:
+    """Return the prime factorization of n as a {prime: exponent} dict.
+
+    prime_factors(1) is an empty dict. Raises ValueError for n < 1.
+    """
+    if n < 1:
+        raise ValueError("prime_factors is only defined for positive integers")
+    factors: dict[int, int] = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    pending = [n] if n > 1 else []
+    while pending:
+        n = pending.pop()
+        root = math.isqrt(n)
+        if is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        elif root * root == n:
+            pending += [root, root]
+        else:
+            d = pollard_brent(n)
+            pending += [d, n // d]
+    return dict(sorted(factors.items()))
@@ -0,0 +1,70 @@
+# Compute areas for many shapes at once from columnar input:
+#
+#     registry = ShapeRegistry()
+#     registry.register("rectangle", area_rectangle, rectangle_kernel, dimensions=2)
+#     registry.areas(["rectangle", "circle", ...], first_dims, second_dims)
+#
+# Each shape is registered with its scalar function and a vectorized kernel
+# side by side. areas() groups the rows by shape and calls each kernel once
+# on that group's columns (NumPy arrays), then scatters the results back into
+# input order. Without NumPy the scalar functions are applied row by row.
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; areas() falls back to the scalar functions
+    np = None
+
+class ShapeRegistry:
+    """Scalar and vectorized area functions for a set of named shapes."""
+
+    def __init__(self) -> None:
+        self.scalars = {}      # name -> f(*dimensions) -> float
+        self.kernels = {}      # name -> f(*dimension_arrays) -> array
+        self.dimensions = {}   # name -> number of dimension columns used
+
+    def register(self, name: str, scalar, kernel, dimensions: int) -> None:
+        """Add a shape. kernel takes the same arguments as scalar, as float64 arrays."""
+        self.scalars[name] = scalar
+        self.kernels[name] = kernel
+        self.dimensions[name] = dimensions
+
+    def _check(self, names, length: int, columns) -> None:
+        """Reject unknown shapes and missing or ragged columns before any work is done."""
+        if any(len(c) != length for c in columns):
+            raise ValueError("kinds and every dimension column must have the same length")
+        for name in names:
+            if name not in self.scalars:
+                raise ValueError(f"Unknown shape {name!r}; expected one of {sorted(self.scalars)}")
+            if self.dimensions[name] > len(columns):
+                raise ValueError(f"{name} needs {self.dimensions[name]} dimension columns, got {len(columns)}")
+
+    def areas(self, kinds, *columns):
+        """Return the area of every row, in input order.
+
+        kinds holds one shape name per row; columns[i] holds every row's
+        i-th dimension (a shape with k dimensions reads the first k columns
+        and ignores the rest). Returns a float64 NumPy array, or an
+        array('d') when NumPy is not installed.
+        """
+        if np is None:
+            return self._areas_scalar(list(kinds), [list(c) for c in columns])
+        kinds = np.asarray(kinds)
+        columns = [np.asarray(c, dtype=np.float64) for c in columns]
+        names, inverse = np.unique(kinds, return_inverse=True)
+        self._check(names.tolist(), len(kinds), columns)
+        result = np.empty(len(kinds), dtype=np.float64)
+        for group, name in enumerate(names.tolist()):
+            rows = np.flatnonzero(inverse == group)
+            args = [c[rows] for c in columns[:self.dimensions[name]]]
+            result[rows] = self.kernels[name](*args)
+        return result
+
+    def _areas_scalar(self, kinds: list, columns: list) -> array:
+        """Pure-Python fallback for areas()."""
+        self._check(set(kinds), len(kinds), columns)
+        result = array('d', bytes(8 * len(kinds)))
+        for i, name in enumerate(kinds):
+            result[i] = self.scalars[name](*(c[i] for c in columns[:self.dimensions[name]]))
+        return result
@@ -0,0 +1,91 @@
+# Run recursive algorithms on an explicit stack instead of Python's call stack.
+#
+# A recursive function is written as a generator: wherever it would call
+# itself it yields the generator for the sub-call instead, and receives the
+# sub-call's result back as the value of the yield:
+#
+#     def _sum_steps(n):
+#         if n <= 0:
+#             return 0
+#         return n + (yield _sum_steps(n - 1))
+#
+#     run(_sum_steps(100_000))
+#
+# run() keeps the pending generators in a list, so the depth is limited only
+# by memory, never by sys.getrecursionlimit().
+
+import sys
+import time
+
+def run(root):
+    """Drive the generator root (and every generator it yields) to completion.
+
+    Returns root's return value. An exception raised in a sub-call is thrown
+    into its caller at the yield, exactly where a normal recursive call would
+    have raised it, so try/except in the recursive code keeps working.
+    """
+    stack = [root]
+    value, error = None, None
+    while stack:
+        gen = stack[-1]
+        try:
+            child = gen.send(value) if error is None else gen.throw(error)
+        except StopIteration as done:
+            stack.pop()
+            value, error = done.value, None
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            value, error = None, exc
+        else:
+            stack.append(child)
+            value, error = None, None
+    return value
+
+def _sum_native(n: int) -> int:
+    """Plain recursive sum 1..n, the 'before' case of the benchmark."""
+    if n <= 0:
+        return 0
+    return n + _sum_native(n - 1)
+
+def _sum_steps(n: int):
+    """Trampolined sum 1..n, the 'after' case of the benchmark."""
+    if n <= 0:
+        return 0
+    return n + (yield _sum_steps(n - 1))
+
+def _max_depth(func, limit: int) -> int:
+    """Largest power-of-two depth up to limit that func survives."""
+    depth = 1
+    while depth * 2 <= limit:
+        try:
+            func(depth * 2)
+        except RecursionError:
+            break
+        depth *= 2
+    return depth
+
+def benchmark(depth: int = 500, repeat: int = 200, depth_limit: int = 1 << 20) -> None:
+    """Compare native recursion with run() on depth limit and time per call."""
+    print("=" * 60)
+    print("RECURSION VS TRAMPOLINE BENCHMARK")
+    print("=" * 60)
+    native = _max_depth(_sum_native, depth_limit)
+    trampolined = _max_depth(lambda n: run(_sum_steps(n)), depth_limit)
+    print(f"Recursion limit (sys):  {sys.getrecursionlimit()}")
+    print(f"Deepest native call:    {native}")
+    print(f"Deepest trampolined:    {trampolined}{'+' if trampolined * 2 > depth_limit else ''}")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _sum_native(depth)
+    t_native = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run(_sum_steps(depth))
+    t_tramp = (time.perf_counter() - start) / repeat
+    print(f"Depth {depth}, native:       {1e6 * t_native:.1f} us/call")
+    print(f"Depth {depth}, trampolined:  {1e6 * t_tramp:.1f} us/call")
+
+if __name__ == "__main__":
+    benchmark()